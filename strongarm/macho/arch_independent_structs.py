@@ -1,6 +1,7 @@
-from ctypes import Structure, c_uint64, sizeof
+import struct
+from ctypes import Structure, c_int8, c_int16, c_int32, c_int64, c_uint8, c_uint16, c_uint32, c_uint64, sizeof
 from distutils.version import LooseVersion
-from typing import TYPE_CHECKING, Any, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
 
 from strongarm.logger import strongarm_logger
 from strongarm.macho.macho_definitions import (
@@ -133,10 +134,72 @@ _64_BIT_STRUCT_ALIAS = Union[
 ]
 
 
+# The struct module format characters of the scalar ctypes field types
+_SCALAR_FIELD_FORMATS: Dict[Any, str] = {
+    c_uint8: "B",
+    c_uint16: "H",
+    c_uint32: "I",
+    c_uint64: "Q",
+    c_int8: "b",
+    c_int16: "h",
+    c_int32: "i",
+    c_int64: "q",
+}
+
+
+class _BackingLayoutInfo:
+    """Precomputed facts about a ctypes backing layout, so that they're not rediscovered on every struct read.
+    Where possible, structures are unpacked with a precompiled struct.Struct rather than through a ctypes Structure,
+    which avoids the overhead of ctypes field access and is several times faster.
+    """
+
+    __slots__ = ["field_names", "flat_format", "pointer_fields"]
+
+    def __init__(self, backing_layout: Type[Structure]) -> None:
+        self.field_names = [field_name for field_name, *_ in backing_layout._fields_]
+        # The name and offset of each field which may hold a rebased pointer
+        self.pointer_fields = [
+            (field_name, getattr(backing_layout, field_name).offset)
+            for field_name, field_type, *_ in backing_layout._fields_
+            if field_type == c_uint64
+        ]
+        self.flat_format = self._build_flat_format(backing_layout)
+
+    @staticmethod
+    def _build_flat_format(backing_layout: Type[Structure]) -> Optional[struct.Struct]:
+        """If the layout is made up solely of native-endian scalar fields, return a precompiled struct.Struct which
+        unpacks the same field values as the ctypes layout. Otherwise, return None.
+        """
+        # Byte-swapped layouts (such as BigEndianStructure on a little-endian host) use a different metaclass
+        if type(backing_layout) is not type(Structure):
+            return None
+
+        struct_format = "="
+        cursor = 0
+        for field in backing_layout._fields_:
+            field_name, field_type, *bitfield_width = field
+            field_format = _SCALAR_FIELD_FORMATS.get(field_type)
+            if not field_format or bitfield_width:
+                return None
+            field_offset = getattr(backing_layout, field_name).offset
+            if field_offset < cursor:
+                return None
+            struct_format += "x" * (field_offset - cursor) + field_format
+            cursor = field_offset + sizeof(field_type)
+
+        struct_format += "x" * (sizeof(backing_layout) - cursor)
+        return struct.Struct(struct_format)
+
+
+_ArchIndependentStructureT = TypeVar("_ArchIndependentStructureT", bound="ArchIndependentStructure")
+
+
 class ArchIndependentStructure:
     _32_BIT_STRUCT: Optional[_32_BIT_STRUCT_ALIAS] = None
     _64_BIT_STRUCT: Optional[_64_BIT_STRUCT_ALIAS] = None
 
+    _BACKING_LAYOUT_INFO: Dict[Type[Structure], _BackingLayoutInfo] = {}
+
     @classmethod
     def get_backing_data_layout(
         cls, is_64bit: bool = True, minimum_deployment_target: Optional[LooseVersion] = None
@@ -155,12 +218,74 @@ class ArchIndependentStructure:
 
         return struct_type
 
-    def __init__(self, binary_offset: int, struct_bytes: bytearray, backing_layout: Type[Structure]):
-        struct: ArchIndependentStructure = backing_layout.from_buffer(struct_bytes)  # type: ignore
+    @staticmethod
+    def backing_layout_info(backing_layout: Type[Structure]) -> _BackingLayoutInfo:
+        layout_info = ArchIndependentStructure._BACKING_LAYOUT_INFO.get(backing_layout)
+        if layout_info is None:
+            layout_info = _BackingLayoutInfo(backing_layout)
+            ArchIndependentStructure._BACKING_LAYOUT_INFO[backing_layout] = layout_info
+        return layout_info
+
+    @classmethod
+    def from_field_values(
+        cls: Type[_ArchIndependentStructureT],
+        binary_offset: int,
+        field_values: Iterable[Any],
+        backing_layout: Type[Structure],
+    ) -> _ArchIndependentStructureT:
+        """Construct a structure from field values which have already been read, in the order of the layout's fields."""
+        structure = cls.__new__(cls)
+        for field_name, field_value in zip(cls.backing_layout_info(backing_layout).field_names, field_values):
+            setattr(structure, field_name, field_value)
+        structure.sizeof = sizeof(backing_layout)
+        structure.binary_offset = binary_offset
+        return structure
+
+    @classmethod
+    def _read_struct_array_fields(
+        cls, binary: "MachoBinary", address: VirtualMemoryPointer, count: int, backing_layout: Type[Structure]
+    ) -> List[Tuple[int, ...]]:
+        """Read the `count` structures with the provided layout which are laid out contiguously from the provided
+        binary address, and return the field values of each. Rebased pointers are applied to each pointer field.
+        """
+        layout_info = cls.backing_layout_info(backing_layout)
+        if not layout_info.flat_format:
+            raise ValueError(f"{backing_layout} cannot be read as a flat array of scalar fields")
+        entries = binary.read_struct_array(address, layout_info.flat_format, count, virtual=True)
+
+        rebased_pointers = binary.dyld_rebased_pointers
+        if not layout_info.pointer_fields or not rebased_pointers:
+            return entries
+
+        field_names = layout_info.field_names
+        pointer_field_indexes = [
+            (field_names.index(field_name), field_offset) for field_name, field_offset in layout_info.pointer_fields
+        ]
+        entry_size = sizeof(backing_layout)
+        rebased_entries: List[Tuple[int, ...]] = []
+        entry_address = address
+        for entry in entries:
+            field_values = list(entry)
+            for field_index, field_offset in pointer_field_indexes:
+                field_values[field_index] = rebased_pointers.get(
+                    entry_address + field_offset, field_values[field_index]
+                )
+            rebased_entries.append(tuple(field_values))
+            entry_address += entry_size
+        return rebased_entries
 
-        for field_name, *_ in struct._fields_:
-            # clone fields from struct to this class
-            setattr(self, field_name, getattr(struct, field_name))
+    def __init__(self, binary_offset: int, struct_bytes: bytearray, backing_layout: Type[Structure]):
+        layout_info = self.backing_layout_info(backing_layout)
+        flat_format = layout_info.flat_format
+        if flat_format and len(struct_bytes) >= flat_format.size:
+            field_values = flat_format.unpack_from(struct_bytes)
+            for field_name, field_value in zip(layout_info.field_names, field_values):
+                setattr(self, field_name, field_value)
+        else:
+            struct: ArchIndependentStructure = backing_layout.from_buffer(struct_bytes)  # type: ignore
+            for field_name in layout_info.field_names:
+                # clone fields from struct to this class
+                setattr(self, field_name, getattr(struct, field_name))
 
         # record size of underlying struct, for when traversing file by structs
         self.sizeof = sizeof(backing_layout)
@@ -261,40 +386,66 @@ class ObjcMethodStruct(ArchIndependentStructure):
         struct_type = cls.get_backing_data_layout(
             binary.is_64bit, binary.get_minimum_deployment_target(), methlist_flags
         )
-        data = binary.get_contents_from_address(address=address, size=sizeof(struct_type), is_virtual=True)
-        method_ent = ObjcMethodStruct(address, data, struct_type)
+        # Apply the same fix-ups as when reading a whole method list
+        method_entry = cls.read_method_list_entries(binary, address, 1, methlist_flags)[0]
+        return cls.from_field_values(address, method_entry, struct_type)
 
-        # If we're parsing the iOS14+ structure that encodes signed 32b offsets instead of 64b absolute addresses,
-        # translate the offsets to absolute addresses for caller convenience.
-        if struct_type == ObjcMethodRelativeData:
-            # Fix up each field by translating it from a 32b signed offset to an absolute address
-            method_entry_off = address
-            method_ent.signature += method_entry_off + 4  # type: ignore
-            method_ent.implementation += method_entry_off + 8  # type: ignore
+    @classmethod
+    def read_method_list_entries(
+        cls, binary: "MachoBinary", address: VirtualMemoryPointer, count: int, methlist_flags: Optional[int] = None
+    ) -> List[Tuple[int, int, int]]:
+        """Read the `count` method structures which are laid out contiguously from the provided binary address.
+        Returns a (name, signature, implementation) tuple for each entry.
+        This method accounts for post-iOS-14 binaries using a relative-offset layout for this structure, and
+         patches the field values to appear as absolute addresses to callers, to match the layout from prior versions.
+        """
+        if not count:
+            return []
 
+        struct_type = cls.get_backing_data_layout(
+            binary.is_64bit, binary.get_minimum_deployment_target(), methlist_flags
+        )
+        entries = cls._read_struct_array_fields(binary, address, count, struct_type)
+        if struct_type != ObjcMethodRelativeData:
+            return entries  # type: ignore
+
+        # If we're parsing the iOS14+ structure that encodes signed 32b offsets instead of 64b absolute addresses,
+        # translate each field from a 32b signed offset to an absolute address
+        entry_size = sizeof(struct_type)
+        signature_offset = ObjcMethodRelativeData.signature.offset
+        implementation_offset = ObjcMethodRelativeData.implementation.offset
+        method_entries: List[Tuple[int, int, int]] = []
+        entry_address = address
+        for name, signature, implementation in entries:
             # Rather than pointing to a selector literal, this field points to a selref. Dereference it now
-            selref_addr = method_ent.name + method_entry_off  # type: ignore
             # This selref may be rebased
-            method_ent.name = binary.read_rebased_pointer(selref_addr)  # type: ignore
-        else:
-            for field_name, field_type, *_ in struct_type._fields_:
-                field_offset = getattr(getattr(struct_type, field_name), "offset")
-                field_address = address + field_offset
-                if field_type == c_uint64 and field_address in binary.dyld_rebased_pointers:
-                    pointer_value = binary.dyld_rebased_pointers[field_address]
-                    logger.debug(
-                        f"Setting rebased pointer within {struct_type}+{field_offset} -> "
-                        f"{pointer_value} at {field_address}"
-                    )
-                    setattr(method_ent, field_name, pointer_value)
-
-        return method_ent
+            name = binary.read_rebased_pointer(VirtualMemoryPointer(entry_address + name))
+            method_entries.append(
+                (
+                    name,
+                    entry_address + signature_offset + signature,
+                    entry_address + implementation_offset + implementation,
+                )
+            )
+            entry_address += entry_size
+        return method_entries
 
 
 class ObjcIvarStruct(ArchIndependentStructure):
     _32_BIT_STRUCT = ObjcIvar32
     _64_BIT_STRUCT = ObjcIvar64
 
+    @classmethod
+    def read_ivar_list_entries(
+        cls, binary: "MachoBinary", address: VirtualMemoryPointer, count: int
+    ) -> List[Tuple[int, int, int]]:
+        """Read the `count` ivar structures which are laid out contiguously from the provided binary address.
+        Returns an (offset_ptr, name, type) tuple for each entry. Rebased pointers are applied to each field.
+        """
+        struct_type = cls.get_backing_data_layout(binary.is_64bit, binary.get_minimum_deployment_target())
+        entries = cls._read_struct_array_fields(binary, address, count, struct_type)
+        return [(offset_ptr, name, type_) for offset_ptr, name, type_, _, _ in entries]
+
 
 class CFStringStruct(ArchIndependentStructure):
     _32_BIT_STRUCT = CFString32
@@ -1,3 +1,4 @@
+import logging
 from ctypes import c_int8, c_int16, c_long, c_uint16, c_uint32, c_uint64, sizeof
 from dataclasses import dataclass, field
 from enum import IntEnum
@@ -235,6 +236,8 @@ class DyldInfoParser:
         rebased_pointers: Dict[VirtualMemoryPointer, VirtualMemoryPointer] = {}
         dyld_bound_addresses_to_symbols: Dict[VirtualMemoryPointer, DyldBoundSymbol] = {}
         virtual_base = binary.get_virtual_base()
+        # Every pointer in the chain is logged. Only build these messages if they'll be emitted
+        debug_logging = logger.isEnabledFor(logging.DEBUG)
         # As each fixup pointer will tell us whether there are any more to follow, loop forever
         # XXX(PT): Impose an upper bound on this loop, just in case
         for _ in range(10000):
@@ -244,21 +247,23 @@ class DyldInfoParser:
                 # Bind. Keep track that there is an imported symbol bind here
                 chained_bind_ptr = binary.read_struct(chain_base, MachoDyldChainedPtr64Bind)
                 bound_symbol = dyld_bound_symbols_table[chained_bind_ptr.ordinal]
-                logger.debug(
-                    f"\t\t{hex(chain_base)}: BIND\tordinal {chained_bind_ptr.ordinal}\t"
-                    f"addend {chained_bind_ptr.addend}\treserved {chained_bind_ptr.reserved}\t"
-                    f"next {chained_bind_ptr.next}\tsymbol {bound_symbol.name}\t\t"
-                    f"dylib {binary.dylib_name_for_library_ordinal(bound_symbol.library_ordinal)}"
-                )
+                if debug_logging:
+                    logger.debug(
+                        f"\t\t{hex(chain_base)}: BIND\tordinal {chained_bind_ptr.ordinal}\t"
+                        f"addend {chained_bind_ptr.addend}\treserved {chained_bind_ptr.reserved}\t"
+                        f"next {chained_bind_ptr.next}\tsymbol {bound_symbol.name}\t\t"
+                        f"dylib {binary.dylib_name_for_library_ordinal(bound_symbol.library_ordinal)}"
+                    )
                 dyld_bound_addresses_to_symbols[chain_base + virtual_base] = bound_symbol
                 chain_base += chained_bind_ptr.next * 4
             else:
                 # Rebase. Keep track that there's a rebased pointer here
-                chained_ptr_raw = binary.read_word(chain_base, word_type=c_uint64, virtual=False)
-                logger.debug(
-                    f"\t\t{hex(chain_base)}: DyldChainedPtr64Rebase(raw: {hex(chained_ptr_raw)}) "
-                    f"target={StaticFilePointer(chained_rebase_ptr.target)}"
-                )
+                if debug_logging:
+                    chained_ptr_raw = binary.read_word(chain_base, word_type=c_uint64, virtual=False)
+                    logger.debug(
+                        f"\t\t{hex(chain_base)}: DyldChainedPtr64Rebase(raw: {hex(chained_ptr_raw)}) "
+                        f"target={StaticFilePointer(chained_rebase_ptr.target)}"
+                    )
                 # The pointer format within this chain tells us how to interpret the target field
                 if pointer_format == MachoDyldChainedPtrFormat.DYLD_CHAINED_PTR_64_OFFSET:
                     # The target field stores an offset from the virtual base rather than an absolute address
@@ -315,12 +320,10 @@ class DyldInfoParser:
     def _parse_dyld_bytestream(
         binary: MachoBinary, file_offset: StaticFilePointer, size: int
     ) -> Dict[VirtualMemoryPointer, DyldBoundSymbol]:
-        from ctypes import sizeof
-
         dyld_stubs_to_symbols: Dict[VirtualMemoryPointer, DyldBoundSymbol] = {}
 
         binding_info = binary.get_bytes(file_offset, size)
-        pointer_size = sizeof(binary.platform_word_type)
+        pointer_size = binary.word_size
 
         index = 0
         name_bytes: bytearray
@@ -1,5 +1,8 @@
+import mmap
+import struct
 from ctypes import c_uint32, sizeof
 from pathlib import Path
+from types import TracebackType
 from typing import Dict, List, Optional, Tuple, Type, TypeVar
 
 from _ctypes import Structure
@@ -50,12 +53,35 @@ class DyldSharedCacheParser:
         # - The VM pointer to the end-address of the Mach-O's __TEXT segment
         self.embedded_binary_info: Dict[Path, Tuple[VirtualMemoryPointer, VirtualMemoryPointer]] = {}
 
-        self._parse()
+        # Shared caches are over a gigabyte, and every read of an embedded binary goes through get_bytes().
+        # Map the file once, rather than opening it for each read, and let the OS page in the regions that are used
+        with open(str(self.path), "rb") as binary_file:
+            self._file_mapping = mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> "DyldSharedCacheParser":
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the mapping of the input file.
+        The parser, and any binaries read from it, can no longer read from the file once this has been called.
+        """
+        self._file_mapping.close()
 
     @property
     def file_magic(self) -> int:
         """Read file magic."""
-        return c_uint32.from_buffer(bytearray(self.get_bytes(StaticFilePointer(0), sizeof(c_uint32)))).value
+        return struct.unpack_from("=I", self.get_bytes(StaticFilePointer(0), sizeof(c_uint32)))[0]
 
     def get_bytes(self, offset: StaticFilePointer, size: int) -> bytes:
         """Read a region of bytes from the input file
@@ -65,9 +91,7 @@ class DyldSharedCacheParser:
         Returns:
             Byte list representing contents of file at provided address
         """
-        with open(str(self.path), "rb") as binary_file:
-            binary_file.seek(offset)
-            return binary_file.read(size)
+        return self._file_mapping[offset : offset + size]
 
     def read_struct(self, file_offset: StaticFilePointer, struct_type: Type[_StructureT]) -> _StructureT:
         """Given a file offset, return the structure it describes
@@ -4,6 +4,7 @@ import shutil
 import sqlite3
 import tempfile
 import time
+from collections import OrderedDict
 from contextlib import closing
 from ctypes import sizeof
 from dataclasses import dataclass
@@ -153,6 +154,10 @@ class MachoAnalyzer:
     # XXX(PT): These references live to process termination, or until clear_cache() is called
     _ANALYZER_CACHE: Dict[MachoBinary, "MachoAnalyzer"] = {}
 
+    # The number of analyzers get_function_analyzer() keeps for each binary.
+    # Each one holds its function's disassembly, so don't keep one for every function in the binary
+    _FUNCTION_ANALYZER_CACHE_SIZE = 128
+
     def __init__(self, binary: MachoBinary) -> None:
         self.binary = binary
         self.cs = Cs(CS_ARCH_ARM64, CS_MODE_ARM)
@@ -168,6 +173,8 @@ class MachoAnalyzer:
         self.imp_stubs = MachoImpStubsParser(binary, self.cs).imp_stubs
         self._objc_helper: Optional[ObjcRuntimeDataParser] = None
         self._objc_method_list: List[ObjcMethodInfo] = []
+        # The most recently used analyzers from get_function_analyzer(), by entry point
+        self._function_analyzer_cache: "OrderedDict[VirtualMemoryPointer, ObjcFunctionAnalyzer]" = OrderedDict()
 
         # Use a temporary database to store cross-referenced data. This provides constant-time lookups for things like
         # finding all the calls to a particular function.
@@ -445,6 +452,14 @@ class MachoAnalyzer:
         self._imported_symbol_addresses_to_names = symbol_name_map
         return symbol_name_map
 
+    @cached_property
+    def _imp_stub_addresses(self) -> Set[VirtualMemoryPointer]:
+        return {stub.address for stub in self.imp_stubs}
+
+    def is_imp_stub_address(self, address: VirtualMemoryPointer) -> bool:
+        """Return whether the address is the start of a __stubs trampoline, rather than of a function in the binary."""
+        return address in self._imp_stub_addresses
+
     @cached_property
     def imported_symbols_to_symbol_names(self) -> Dict[VirtualMemoryPointer, str]:
         """Return a Dict of imported symbol pointers to their names.
@@ -543,6 +558,26 @@ class MachoAnalyzer:
             implementation_analyzers.append(function_analyzer)
         return implementation_analyzers
 
+    def get_function_analyzer(self, start_address: VirtualMemoryPointer) -> "ObjcFunctionAnalyzer":
+        """Get the shared analyzer for the function at start_address.
+        The most recently used analyzers are cached, so repeated requests for the same function return the same object.
+        """
+        from strongarm.objc import ObjcFunctionAnalyzer  # noqa: F811
+
+        function_analyzer_cache = self._function_analyzer_cache
+        function_analyzer = function_analyzer_cache.get(start_address)
+        if function_analyzer is not None:
+            function_analyzer_cache.move_to_end(start_address)
+            return function_analyzer
+
+        instructions = self.get_function_instructions(start_address)
+        function_analyzer = ObjcFunctionAnalyzer(self.binary, instructions)
+        function_analyzer_cache[start_address] = function_analyzer
+        if len(function_analyzer_cache) > self._FUNCTION_ANALYZER_CACHE_SIZE:
+            # Evict the least recently used analyzer
+            function_analyzer_cache.popitem(last=False)
+        return function_analyzer
+
     def get_objc_methods(self) -> List["ObjcMethodInfo"]:
         """Get a List of ObjcMethodInfo's representing all ObjC methods implemented in the Mach-O."""
         from strongarm.objc import ObjcMethodInfo  # type: ignore
@@ -670,7 +705,9 @@ class MachoAnalyzer:
     def get_cstrings(self) -> Set[str]:
         """Return the list of strings in the binary's __cstring section."""
         if not self.__cached_cstrings:
-            self.__cached_cstrings = self._strings_in_section("__cstring")
+            # The __cstring section was already split into its strings when building the stringref map,
+            # so reuse that rather than walking the section again
+            self.__cached_cstrings = set(self._cstring_to_stringref_map.keys())
         return self.__cached_cstrings
 
     def _build_cstring_map(self) -> Dict[str, VirtualMemoryPointer]:
@@ -679,12 +716,10 @@ class MachoAnalyzer:
             return {}
 
         strings_base = strings_section.address
-        strings_content = self.binary.get_bytes(strings_section.offset, strings_section.size)
+        strings_content = bytes(self.binary.get_bytes(strings_section.offset, strings_section.size))
 
         string_to_stringrefs = {}
-        # split into characters (string table is packed and each entry is terminated by a null character)
-        string_table = list(strings_content)
-        transformed_strings = MachoStringTableHelper.transform_string_section(string_table)
+        transformed_strings = MachoStringTableHelper.transform_string_section(strings_content)
         for idx, entry in transformed_strings.items():
             # Address is the base of __cstring plus the index of the entry
             stringref_address = VirtualMemoryPointer(strings_base + idx)
@@ -829,7 +864,7 @@ class MachoAnalyzer:
         discovered_strings = set()
         string_section = self.binary.section_with_name(section_name, "__TEXT")
         if string_section:
-            strings_content = self.binary.get_bytes(string_section.offset, string_section.size)
-            transformed_strings = MachoStringTableHelper.transform_string_section(list(strings_content))
+            strings_content = bytes(self.binary.get_bytes(string_section.offset, string_section.size))
+            transformed_strings = MachoStringTableHelper.transform_string_section(strings_content)
             discovered_strings = set((x.full_string for x in transformed_strings.values()))
         return discovered_strings
@@ -1,5 +1,8 @@
+import logging
 import math
-from ctypes import c_uint32, c_uint64, sizeof
+import struct
+from bisect import bisect_right
+from ctypes import c_uint16, c_uint32, c_uint64, sizeof
 from distutils.version import LooseVersion
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type, TypeVar
@@ -18,7 +21,6 @@ from strongarm.macho.arch_independent_structs import (
     MachoEncryptionInfoStruct,
     MachoHeaderStruct,
     MachoLinkeditDataCommandStruct,
-    MachoLoadCommandStruct,
     MachoNlistStruct,
     MachoSectionRawStruct,
     MachoSegmentCommandStruct,
@@ -45,6 +47,15 @@ logger = strongarm_logger.getChild(__file__)
 
 AIS = TypeVar("AIS", bound=ArchIndependentStructure)
 
+# Unpackers for the word types passed to MachoBinary.read_word(), in native byte order like the ctypes types themselves
+_WORD_STRUCTS = {
+    c_uint16: struct.Struct("=H"),
+    c_uint32: struct.Struct("=I"),
+    c_uint64: struct.Struct("=Q"),
+}
+# The (cmd, cmdsize) fields shared by every load command, as in MachoLoadCommandStruct
+_LOAD_COMMAND_HEADER_STRUCT = struct.Struct("=II")
+
 
 class BinaryEncryptedError(Exception):
     """Raised when the binary is encrypted."""
@@ -125,6 +136,8 @@ class MachoBinary:
         from .codesign.codesign_parser import CodesignParser
 
         self._cached_binary = binary_data
+        # Slicing a memoryview doesn't copy, so reads from the binary only copy the requested bytes once
+        self._cached_binary_view = memoryview(binary_data)
 
         self.path = path
         self.is_64bit: bool = False
@@ -143,6 +156,8 @@ class MachoBinary:
         # Segment and section commands from Mach-O header
         self.segments: List[MachoSegment] = []
         self.sections: List[MachoSection] = []
+        # Sorted section start addresses, used to look up the section containing an address. See section_for_address()
+        self._section_address_index: Optional[Tuple[int, List[int], List[MachoSection]]] = None
         # Interesting Mach-O sections
         self._dysymtab: Optional[MachoDysymtabCommandStruct] = None
         self._symtab: Optional[MachoSymtabCommandStruct] = None
@@ -166,6 +181,8 @@ class MachoBinary:
             raise RuntimeError("Failed to parse Mach-O")
 
         self.platform_word_type = c_uint64 if self.is_64bit else c_uint32
+        # Size of a pointer in this binary. Cached as it's needed whenever pointer arrays are read
+        self.word_size = sizeof(self.platform_word_type)
 
         self._symtab_contents: Optional[List[MachoNlistStruct]] = None
         logger.debug(self, f"parsed symtab, len = {len(self.symtab_contents)}")
@@ -278,9 +295,12 @@ class MachoBinary:
         self.load_dylib_commands = []
 
         for i in range(ncmds):
-            load_command = self.read_struct(offset, MachoLoadCommandStruct)
+            # Every load command begins with its (cmd, cmdsize). Read just these to decide how to parse the command
+            cmd, cmdsize = _LOAD_COMMAND_HEADER_STRUCT.unpack_from(
+                self.get_bytes(offset, _LOAD_COMMAND_HEADER_STRUCT.size)
+            )
 
-            if load_command.cmd in [MachoLoadCommands.LC_SEGMENT, MachoLoadCommands.LC_SEGMENT_64]:
+            if cmd in [MachoLoadCommands.LC_SEGMENT, MachoLoadCommands.LC_SEGMENT_64]:
                 segment_command = self.read_struct(offset, MachoSegmentCommandStruct)
                 # TODO(PT) handle byte swap of segment if necessary
                 segment = MachoSegment(segment_command)
@@ -289,40 +309,40 @@ class MachoBinary:
 
             # some commands have their own structure that we interpret separately from a normal load command
             # if we want to interpret more commands in the future, this is the place to do it
-            elif load_command.cmd in [MachoLoadCommands.LC_ENCRYPTION_INFO, MachoLoadCommands.LC_ENCRYPTION_INFO_64]:
+            elif cmd in [MachoLoadCommands.LC_ENCRYPTION_INFO, MachoLoadCommands.LC_ENCRYPTION_INFO_64]:
                 self._encryption_info = self.read_struct(offset, MachoEncryptionInfoStruct)
 
-            elif load_command.cmd == MachoLoadCommands.LC_SYMTAB:
+            elif cmd == MachoLoadCommands.LC_SYMTAB:
                 self._symtab = self.read_struct(offset, MachoSymtabCommandStruct)
 
-            elif load_command.cmd == MachoLoadCommands.LC_DYSYMTAB:
+            elif cmd == MachoLoadCommands.LC_DYSYMTAB:
                 self._dysymtab = self.read_struct(offset, MachoDysymtabCommandStruct)
 
-            elif load_command.cmd in [MachoLoadCommands.LC_DYLD_INFO, MachoLoadCommands.LC_DYLD_INFO_ONLY]:
+            elif cmd in [MachoLoadCommands.LC_DYLD_INFO, MachoLoadCommands.LC_DYLD_INFO_ONLY]:
                 self._dyld_info = self.read_struct(offset, MachoDyldInfoCommandStruct)
 
-            elif load_command.cmd in [MachoLoadCommands.LC_DYLD_EXPORTS_TRIE]:
+            elif cmd in [MachoLoadCommands.LC_DYLD_EXPORTS_TRIE]:
                 self._dyld_export_trie = self.read_struct(offset, MachoLinkeditDataCommandStruct)
 
-            elif load_command.cmd in [MachoLoadCommands.LC_DYLD_CHAINED_FIXUPS]:
+            elif cmd in [MachoLoadCommands.LC_DYLD_CHAINED_FIXUPS]:
                 self._dyld_chained_fixups = self.read_struct(offset, MachoLinkeditDataCommandStruct)
 
-            elif load_command.cmd in [MachoLoadCommands.LC_LOAD_DYLIB, MachoLoadCommands.LC_LOAD_WEAK_DYLIB]:
+            elif cmd in [MachoLoadCommands.LC_LOAD_DYLIB, MachoLoadCommands.LC_LOAD_WEAK_DYLIB]:
                 dylib_load_command = self.read_struct(offset, DylibCommandStruct)
                 self.load_dylib_commands.append(dylib_load_command)
 
-            elif load_command.cmd == MachoLoadCommands.LC_CODE_SIGNATURE:
+            elif cmd == MachoLoadCommands.LC_CODE_SIGNATURE:
                 self._code_signature_cmd = self.read_struct(offset, MachoLinkeditDataCommandStruct)
 
-            elif load_command.cmd == MachoLoadCommands.LC_FUNCTION_STARTS:
+            elif cmd == MachoLoadCommands.LC_FUNCTION_STARTS:
                 self._function_starts_cmd = self.read_struct(offset, MachoLinkeditDataCommandStruct)
 
-            elif load_command.cmd == MachoLoadCommands.LC_ID_DYLIB:
+            elif cmd == MachoLoadCommands.LC_ID_DYLIB:
                 self._id_dylib_cmd = self.read_struct(offset, DylibCommandStruct)
                 # This load command should only be present for dylibs. Validate this assumption
                 assert self.file_type == MachoFileType.MH_DYLIB
 
-            elif load_command.cmd == MachoLoadCommands.LC_BUILD_VERSION:
+            elif cmd == MachoLoadCommands.LC_BUILD_VERSION:
                 self._build_version_cmd = self.read_struct(offset, MachoBuildVersionCommandStruct)
                 # Parse the build tool versions following this structure
                 build_tool_offset = offset + self._build_version_cmd.sizeof
@@ -332,7 +352,7 @@ class MachoBinary:
                     self._build_tool_versions.append(build_tool_version)
 
             # move to next load command in header
-            offset += load_command.cmdsize
+            offset += cmdsize
 
     def read_struct(self, binary_offset: int, struct_type: Type[AIS], virtual: bool = False) -> AIS:
         """Given an binary offset, return the structure it describes.
@@ -364,18 +384,35 @@ class MachoBinary:
         base_virt_offset = binary_offset
         if not virtual:
             base_virt_offset += self.get_virtual_base()
-        for field_name, field_type, *_ in backing_layout._fields_:
-            field_offset = getattr(getattr(backing_layout, field_name), "offset")
+        debug_logging = logger.isEnabledFor(logging.DEBUG)
+        for field_name, field_offset in struct_type.backing_layout_info(backing_layout).pointer_fields:
             field_address = base_virt_offset + field_offset
-            if field_type == c_uint64 and field_address in self.dyld_rebased_pointers:
-                logger.debug(
-                    f"Setting rebased pointer within {struct_type}+{field_offset} -> "
-                    f"{self.dyld_rebased_pointers[field_address]} at {field_address}"
-                )
+            if field_address in self.dyld_rebased_pointers:
+                if debug_logging:
+                    logger.debug(
+                        f"Setting rebased pointer within {struct_type}+{field_offset} -> "
+                        f"{self.dyld_rebased_pointers[field_address]} at {field_address}"
+                    )
                 setattr(s, field_name, self.dyld_rebased_pointers[field_address])
 
         return s
 
+    def read_struct_array(
+        self, address: int, struct_format: struct.Struct, count: int, virtual: bool = True
+    ) -> List[Tuple[Any, ...]]:
+        """Read an array of `count` contiguous records with the provided layout, and return the fields of each record.
+        The array is read from the binary at once and unpacked in a single pass. Callers are responsible for applying
+        rebases.
+        """
+        if not count:
+            return []
+
+        size = struct_format.size * count
+        data = self.get_contents_from_address(address=address, size=size, is_virtual=virtual)
+        if len(data) < size:
+            raise InvalidAddressError(f"Could not read {count} structures at address {hex(address)}")
+        return list(struct_format.iter_unpack(data))
+
     def section_name_for_address(self, virt_addr: VirtualMemoryPointer) -> Optional[str]:
         """Given an address in the virtual address space, return the name of the section which contains it."""
         section = self.section_for_address(virt_addr)
@@ -383,12 +420,32 @@ class MachoBinary:
             return None
         return section.name
 
+    def _build_section_address_index(self) -> Tuple[List[int], List[MachoSection]]:
+        """Return the start addresses of the non-empty sections in ascending order, along with the sections themselves.
+        If any sections overlap, an address may be contained in several sections, and only the linear search in
+        section_for_address() will find the right one. In this case, empty lists are returned.
+        """
+        sorted_sections = sorted((s for s in self.sections if s.size), key=lambda s: s.address)
+        for section, next_section in zip(sorted_sections, sorted_sections[1:]):
+            if section.end_address > next_section.address:
+                return [], []
+        return [s.address for s in sorted_sections], sorted_sections
+
     def section_for_address(self, virt_addr: VirtualMemoryPointer) -> Optional[MachoSection]:
         """Given an address in the virtual address space, return the section which contains it."""
         # invalid address?
         if virt_addr < self.get_virtual_base():
             return None
 
+        # Translating addresses is very hot, so bisect the sorted section list rather than searching it linearly.
+        # The index is rebuilt if sections have been added since it was built
+        if self._section_address_index is None or self._section_address_index[0] != len(self.sections):
+            self._section_address_index = (len(self.sections), *self._build_section_address_index())
+        _, section_addresses, sorted_sections = self._section_address_index
+        idx = bisect_right(section_addresses, virt_addr) - 1
+        if idx >= 0 and virt_addr < sorted_sections[idx].end_address:
+            return sorted_sections[idx]
+
         # if the address given is past the last declared section, translate based on the last section
         # so, we need to keep track of the last seen section
         max_section = next(iter(self.sections))
@@ -457,7 +514,8 @@ class MachoBinary:
             int containing the virtual memory space address that the Mach-O slice requests to begin at
 
         """
-        if not self._virtual_base:
+        # Dylibs are typically based at 0, so compare against None to cache that base too
+        if self._virtual_base is None:
             text_seg = self.segment_with_name("__TEXT")
             if not text_seg:
                 raise RuntimeError("Could not find virtual base because binary has no __TEXT segment.")
@@ -501,7 +559,7 @@ class MachoBinary:
                 f"Cannot read encrypted range [{hex(encryption_range_start)} - {hex(encryption_range_end)}]"
             )
 
-        return bytearray(self._cached_binary[offset : offset + size])
+        return bytearray(self._cached_binary_view[offset : offset + size])
 
     def should_swap_bytes(self) -> bool:
         """Check whether self.slice_magic refers to a big-endian Mach-O binary
@@ -558,11 +616,12 @@ class MachoBinary:
         indirect_symtab_off = self.dysymtab.indirectsymoff
 
         # indirect symtab is an array of uint32's
+        entry_size = sizeof(c_uint32)
         for i in range(self.dysymtab.nindirectsyms):
             indirect_symtab_entry = self.read_word(indirect_symtab_off, virtual=False, word_type=c_uint32)
             indirect_symtab.append(int(indirect_symtab_entry))
             # traverse to next pointer
-            indirect_symtab_off += sizeof(c_uint32)
+            indirect_symtab_off += entry_size
         return indirect_symtab
 
     def file_offset_for_virtual_address(self, virtual_address: VirtualMemoryPointer) -> StaticFilePointer:
@@ -722,34 +781,17 @@ class MachoBinary:
             # Couldn't find the desired section
             return {}
 
-        address_to_pointer_map: Dict[VirtualMemoryPointer, VirtualMemoryPointer] = {}
-
-        section_base = section.address
+        section_base = VirtualMemoryPointer(section.address)
         section_data = self.get_bytes(section.offset, section.size)
+        # Ignore any trailing bytes which don't make up a full pointer
+        pointer_count = len(section_data) // self.word_size
+        pointers = self._decode_rebased_pointers(section_base, section_data[: pointer_count * self.word_size])
+        logger.debug(f"Read {pointer_count} pointers from {section_name}")
 
-        binary_word = self.platform_word_type
-        pointer_count = int(len(section_data) / sizeof(binary_word))
-        pointer_off = 0
-
-        for i in range(pointer_count):
-            # convert section offset of entry to absolute virtual address
-            ptr_location = VirtualMemoryPointer(section_base + pointer_off)
-
-            if ptr_location in self.dyld_rebased_pointers:
-                ptr_value = self.dyld_rebased_pointers[ptr_location]
-                logger.debug(f"Pointer is rebased: {ptr_location} -> {ptr_value}")
-            else:
-                data_end = pointer_off + sizeof(binary_word)
-                ptr_value = VirtualMemoryPointer(
-                    binary_word.from_buffer(bytearray(section_data[pointer_off:data_end])).value
-                )
-                logger.debug(f"Pointer was not in the rebase list: {ptr_location} -> {ptr_value}")
-
-            address_to_pointer_map[ptr_location] = VirtualMemoryPointer(ptr_value)
-
-            pointer_off += sizeof(binary_word)
-
-        return address_to_pointer_map
+        # Convert the index of each entry to its absolute virtual address
+        return {
+            VirtualMemoryPointer(section_base + (i * self.word_size)): pointer for i, pointer in enumerate(pointers)
+        }
 
     def read_word(self, address: int, virtual: bool = True, word_type: Any = None) -> int:
         """Attempt to read a word from the binary at a virtual address."""
@@ -764,6 +806,9 @@ class MachoBinary:
         if not file_bytes:
             raise InvalidAddressError(f"Could not read word at address {hex(address)}")
 
+        word_struct = _WORD_STRUCTS.get(word_type)
+        if word_struct:
+            return word_struct.unpack_from(file_bytes)[0]
         return word_type.from_buffer(bytearray(file_bytes)).value
 
     def read_rebased_pointer(self, address: VirtualMemoryPointer) -> VirtualMemoryPointer:
@@ -776,6 +821,34 @@ class MachoBinary:
 
         return self.dyld_rebased_pointers[address]
 
+    def read_rebased_pointers(self, address: VirtualMemoryPointer, count: int) -> List[VirtualMemoryPointer]:
+        """Attempt to read an array of `count` contiguous rebased pointers from the binary at a virtual address.
+        The array is read from the binary at once, rather than issuing a read for each pointer.
+        """
+        if not count:
+            return []
+
+        word_size = self.word_size
+        file_bytes = self.get_content_from_virtual_address(address, word_size * count)
+        if len(file_bytes) < word_size * count:
+            raise InvalidAddressError(f"Could not read {count} words at address {hex(address)}")
+
+        return self._decode_rebased_pointers(address, file_bytes)
+
+    def _decode_rebased_pointers(self, address: VirtualMemoryPointer, data: bytearray) -> List[VirtualMemoryPointer]:
+        """Decode the array of platform words in `data`, which was read from the provided virtual address.
+        The array is decoded in one pass over a memoryview, rather than through a ctypes structure for each word.
+        If we know about a rebase for a word, the rebased pointer is returned in its place.
+        """
+        word_size = self.word_size
+        rebased_pointers = self.dyld_rebased_pointers
+        pointers: List[VirtualMemoryPointer] = []
+        ptr_location = address
+        for ptr_value in memoryview(data).cast("Q" if self.is_64bit else "I"):
+            pointers.append(rebased_pointers.get(ptr_location, VirtualMemoryPointer(ptr_value)))
+            ptr_location += word_size
+        return pointers
+
     @property
     def header(self) -> MachoHeaderStruct:
         if self._header:
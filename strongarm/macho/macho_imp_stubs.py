@@ -49,10 +49,12 @@ class MachoImpStubsParser:
         # pattern 2: adrp x16, <page> / ldr x16, [x16 <offset>] / br x16
         # try parsing both of these formats
         patterns = [["nop", "ldr", "br"], ["adrp", "ldr", "br"]]
+        # CsInsn decodes the mnemonic on every access, so read each one once
+        mnemonics = [instr1.mnemonic, instr2.mnemonic, instr3.mnemonic]
         # differentiate between patterns by looking at the opcode of the first instruction
-        if instr1.mnemonic == patterns[0][0]:
+        if mnemonics[0] == patterns[0][0]:
             pattern_idx = 0
-        elif instr1.mnemonic == patterns[1][0]:
+        elif mnemonics[0] == patterns[1][0]:
             pattern_idx = 1
         else:
             # unknown stub format
@@ -61,10 +63,10 @@ class MachoImpStubsParser:
         expected_ops = patterns[pattern_idx]
         for idx, op in enumerate([instr1, instr2, instr3]):
             # sanity check
-            if op.mnemonic != expected_ops[idx]:
+            if mnemonics[idx] != expected_ops[idx]:
                 raise RuntimeError(
                     f"Expected instr {hex(op.address)} (idx {idx}) to be {expected_ops[idx]}"
-                    f" while parsing stub, was instead {op.mnemonic}"
+                    f" while parsing stub, was instead {mnemonics[idx]}"
                 )
 
         stub_addr = instr1.address
@@ -1,3 +1,5 @@
+import os
+import struct
 from ctypes import c_uint32, sizeof
 from pathlib import Path
 from typing import List, Optional
@@ -132,7 +134,7 @@ class MachoParser:
             False if the magic is anything else
 
         """
-        magic = c_uint32.from_buffer(bytearray(self.get_bytes(offset, sizeof(c_uint32)))).value
+        magic = struct.unpack_from("=I", self.get_bytes(offset, sizeof(c_uint32)))[0]
         return magic in MachoParser._MACHO_MAGIC
 
     def is_magic_supported(self) -> bool:
@@ -150,7 +152,7 @@ class MachoParser:
     @property
     def file_magic(self) -> int:
         """Read file magic."""
-        return c_uint32.from_buffer(bytearray(self.get_bytes(StaticFilePointer(0), sizeof(c_uint32)))).value
+        return struct.unpack_from("=I", self.get_bytes(StaticFilePointer(0), sizeof(c_uint32)))[0]
 
     @property
     def is_fat(self) -> bool:
@@ -185,6 +187,6 @@ class MachoParser:
             Byte list representing contents of file at provided address
 
         """
-        with open(self.path, "rb") as binary_file:
-            binary_file.seek(offset)
-            return binary_file.read(size)
+        with open(self.path, "rb", buffering=0) as binary_file:
+            # A positional read is a single syscall, and doesn't depend on or move the file's cursor
+            return os.pread(binary_file.fileno(), size, offset)
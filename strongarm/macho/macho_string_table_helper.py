@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from strongarm.macho.macho_binary import MachoBinary, VirtualMemoryPointer
 from strongarm.macho.macho_definitions import NLIST_NTYPE, NTYPE_VALUES
@@ -23,13 +23,15 @@ class MachoStringTableHelper:
 
     def __init__(self, binary: MachoBinary) -> None:
         self.binary = binary
-        self.string_table_entries = MachoStringTableHelper.transform_string_section(self.binary.get_raw_string_table())
+        symtab = self.binary.symtab
+        string_table = bytes(self.binary.get_bytes(symtab.stroff, symtab.strsize))
+        self.string_table_entries = MachoStringTableHelper.transform_string_section(string_table)
         self.imported_symbols: List[str] = []
         self.exported_symbols: Dict[VirtualMemoryPointer, str] = {}
         self.parse_sym_lists()
 
     @classmethod
-    def transform_string_section(cls, strtab: List[int]) -> Dict[int, MachoStringTableEntry]:
+    def transform_string_section(cls, strtab: Union[bytes, List[int]]) -> Dict[int, MachoStringTableEntry]:
         """Create more efficient representation of string table data
 
         Often, tables in a Mach-O will reference data within the string table.
@@ -41,31 +43,38 @@ class MachoStringTableHelper:
         To avoid this, we preprocess the string table into the full strings it represents. To make these lookups easier,
         we create a map of start indexes to MachoStringTableEntry's
 
+        Args:
+            strtab: The packed string table, as bytes or as a list of byte values
+
         Returns:
             Map of string table entry start indexes to MachoStringTableEntry's
         """
         string_table_entries = {}
+        # Search for each NULL terminator with bytes.find() rather than stepping through every character in Python.
+        # This doesn't copy a table which is already bytes
+        strtab_bytes = bytes(strtab)
         entry_start_idx = 0
-        for idx, ch in enumerate(strtab):
+        while True:
             # end of current string?
-            if ch == 0x00:
-                length = idx - entry_start_idx
-
-                # read this string now that we know the start index and length
-                entry_end_idx = entry_start_idx + length
-                entry_byte_content = bytearray(strtab[entry_start_idx:entry_end_idx:])
-                try:
-                    entry_content = entry_byte_content.decode("utf-8")
-                except UnicodeDecodeError:
-                    # get a string literal of the raw bytes. 0x0080 -> "b'\\x00\\x80'"
-                    entry_content = str(bytes(entry_byte_content))
-
-                # record in list
-                ent = MachoStringTableEntry(entry_start_idx, length, entry_content)
-                string_table_entries[entry_start_idx] = ent
-
-                # move to starting index of next string
-                entry_start_idx = idx + 1
+            entry_end_idx = strtab_bytes.find(0, entry_start_idx)
+            if entry_end_idx < 0:
+                break
+            length = entry_end_idx - entry_start_idx
+
+            # read this string now that we know the start index and length
+            entry_byte_content = strtab_bytes[entry_start_idx:entry_end_idx]
+            try:
+                entry_content = entry_byte_content.decode("utf-8")
+            except UnicodeDecodeError:
+                # get a string literal of the raw bytes. 0x0080 -> "b'\\x00\\x80'"
+                entry_content = str(entry_byte_content)
+
+            # record in list
+            ent = MachoStringTableEntry(entry_start_idx, length, entry_content)
+            string_table_entries[entry_start_idx] = ent
+
+            # move to starting index of next string
+            entry_start_idx = entry_end_idx + 1
         return string_table_entries
 
     def string_table_entry_for_strtab_index(self, start_idx: int) -> Optional[MachoStringTableEntry]:
@@ -1,5 +1,6 @@
 from ctypes import c_uint32, c_uint64, sizeof
-from typing import Dict, List, Optional
+from sys import intern
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set
 
 from strongarm.logger import strongarm_logger
 from strongarm.macho.arch_independent_structs import (
@@ -14,21 +15,17 @@ from strongarm.macho.arch_independent_structs import (
     ObjcProtocolListStruct,
     ObjcProtocolRawStruct,
 )
-from strongarm.macho.macho_binary import MachoBinary
+from strongarm.macho.macho_binary import BinaryEncryptedError, MachoBinary
 from strongarm.macho.macho_definitions import VirtualMemoryPointer
 
 logger = strongarm_logger.getChild(__file__)
 
 
-class ObjcSelref:
-    __slots__ = ["source_address", "destination_address", "selector_literal"]
-
-    def __init__(
-        self, source_address: VirtualMemoryPointer, destination_address: VirtualMemoryPointer, selector_literal: str
-    ) -> None:
-        self.source_address = source_address
-        self.destination_address = destination_address
-        self.selector_literal = selector_literal
+class ObjcSelref(NamedTuple):
+    # One of these is created for every selref in the binary, so keep it as compact as a plain tuple
+    source_address: VirtualMemoryPointer
+    destination_address: VirtualMemoryPointer
+    selector_literal: str
 
     def __repr__(self) -> str:
         return (
@@ -38,14 +35,16 @@ class ObjcSelref:
 
 
 class ObjcSelector:
-    __slots__ = ["name", "selref", "implementation", "is_external_definition"]
+    __slots__ = ["name", "selref", "implementation"]
 
     def __init__(self, name: str, selref: Optional[ObjcSelref], implementation: Optional[VirtualMemoryPointer]) -> None:
         self.name = name
         self.selref = selref
         self.implementation = implementation
 
-        self.is_external_definition = not self.implementation
+    @property
+    def is_external_definition(self) -> bool:
+        return not self.implementation
 
     def __str__(self) -> str:
         imp_addr = "NaN"
@@ -103,11 +102,12 @@ class ObjcClass:
 
 
 class ObjcProtocol(ObjcClass):
-    pass
+    __slots__: List[str] = []
 
 
 class ObjcCategory(ObjcClass):
-    __slots__ = ["raw_struct", "name", "base_class", "category_name", "selectors", "ivars", "protocols"]
+    # Only the attributes ObjcClass doesn't already declare. Redeclaring a slot allocates a second, shadowed slot
+    __slots__ = ["base_class", "category_name"]
 
     def __init__(
         self,
@@ -140,32 +140,109 @@ class ObjcRuntimeDataParser:
     def __init__(self, binary: MachoBinary) -> None:
         self.binary = binary
         logger.debug(f"Parsing ObjC runtime info of {self.binary}...")
+        # Used to validate every __objc_data structure we read
+        self._virtual_base = self.binary.get_virtual_base()
+
+        # Index the Objective-C name strings up front, as nearly every runtime structure refers to one of them
+        self._objc_string_index = self._build_objc_string_index()
 
         logger.debug("Step 1: Parsing selrefs...")
         self._selector_literal_ptr_to_selref_map: Dict[VirtualMemoryPointer, ObjcSelref] = {}
         self._selref_ptr_to_selref_map: Dict[VirtualMemoryPointer, ObjcSelref] = {}
-        # Note this mapping is partially filled in now, but gets updated later in the parse
+        # Reverse index of selector names to the first selref which references them
+        self._selector_name_to_selref_ptr: Dict[str, VirtualMemoryPointer] = {}
+        # Note this mapping is filled in as method lists are parsed. Selectors for the remaining selrefs are only
+        # constructed once they're asked for
         self._selref_ptr_to_selector_map: Dict[VirtualMemoryPointer, ObjcSelector] = {}
+        self._has_selector_for_every_selref = False
         # Populates the mappings above
         self._parse_selrefs()
 
         logger.debug("Step 2: Parsing classes, categories, and protocols...")
         self._classrefs_to_objc_classes: Dict[VirtualMemoryPointer, ObjcClass] = {}
+        # Many classes conform to the same protocols. Only parse the method lists of each protocol once
+        self._protocol_cache: Dict[VirtualMemoryPointer, ObjcProtocol] = {}
         # This populates self._classrefs_to_objc_classes
         self.classes = self._parse_class_and_category_info()
         self.protocols = self._parse_global_protocol_info()
+        # Map of selector names to the IMPs of every class method with that name
+        self._selector_name_to_imps = self._build_selector_name_to_imps_map()
+
+        # The symbol name to source dylib map is only needed by path_for_external_symbol(). Rather than building it
+        # up front, the undefined symbols are resolved as lookups need them
+        self._resolved_sym_to_dylib_path: Dict[str, str] = {}
+        # Index into the undefined symbols of the next symbol to resolve
+        self._next_undef_sym_idx = 0
+        # Most symbols are imported from a handful of dylibs, so only read each dylib's name once
+        self._library_ordinal_to_dylib_path: Dict[int, str] = {}
+        self._visited_symbol_string_addresses: Set[int] = set()
+
+    def _build_objc_string_index(self) -> Dict[int, Optional[str]]:
+        """Read the strings in the Objective-C selector and class name sections with one sequential pass over each.
+        Returns a map of the virtual address of each string to its contents.
+        The strings are interned, as the same selector and class names are used as dict keys throughout the parse.
+        """
+        string_index: Dict[int, Optional[str]] = {}
+        for section_name in ["__objc_methname", "__objc_classname"]:
+            section = self.binary.section_with_name(section_name, "__TEXT")
+            if not section:
+                continue
+            try:
+                section_data = bytes(self.binary.get_content_from_virtual_address(section.address, section.size))
+            except BinaryEncryptedError:
+                # Leave these strings to be read individually, which will surface the error to the caller
+                continue
 
-        logger.debug("Step 3: Resolving symbol name to source dylib map...")
-        self._sym_to_dylib_path = self._parse_linked_dylib_symbols()
-
-    def _parse_linked_dylib_symbols(self) -> Dict[str, str]:
-        syms_to_dylib_path = {}
+            string_start = 0
+            while True:
+                string_end = section_data.find(b"\0", string_start)
+                if string_end == -1:
+                    break
+                try:
+                    string_index[section.address + string_start] = intern(
+                        section_data[string_start:string_end].decode()
+                    )
+                except UnicodeDecodeError:
+                    pass
+                string_start = string_end + 1
+        return string_index
+
+    def _read_objc_string(self, address: VirtualMemoryPointer) -> Optional[str]:
+        """Return the string at the provided virtual address, preferring the prebuilt index of ObjC name strings.
+        Strings which are not in the index (such as pointers into the middle of a string) are read from the binary,
+        and then added to the index, as the same strings (like ivar type encodings) tend to be referenced many times.
+        """
+        string_index = self._objc_string_index
+        if address in string_index:
+            return string_index[address]
+        string = self.binary.get_full_string_from_start_address(address)
+        if string:
+            string = intern(string)
+        string_index[address] = string
+        return string
+
+    @property
+    def _sym_to_dylib_path(self) -> Dict[str, str]:
+        # Resolve any symbols which haven't been looked up yet
+        self._resolve_linked_dylib_symbols()
+        return self._resolved_sym_to_dylib_path
+
+    def _resolve_linked_dylib_symbols(self, stop_at_symbol: Optional[str] = None) -> Optional[str]:
+        """Add the undefined symbols which haven't been resolved yet to the symbol name to source dylib map.
+        If stop_at_symbol is provided, stop once it has been added, and return its source dylib.
+        The cursor only advances past a symbol once it has been handled, so a failed read is retried on the next call.
+        """
+        syms_to_dylib_path = self._resolved_sym_to_dylib_path
+        library_ordinal_to_dylib_path = self._library_ordinal_to_dylib_path
+        visited_addresses = self._visited_symbol_string_addresses
 
         symtab = self.binary.symtab
         symtab_contents = self.binary.symtab_contents
         dysymtab = self.binary.dysymtab
-        visited_addresses = set()
-        for undef_sym_idx in range(dysymtab.nundefsym):
+        if self._next_undef_sym_idx == 0:
+            logger.debug("Resolving symbol name to source dylib map...")
+        while self._next_undef_sym_idx < dysymtab.nundefsym:
+            undef_sym_idx = self._next_undef_sym_idx
             symtab_idx = dysymtab.iundefsym + undef_sym_idx
             sym = symtab_contents[symtab_idx]
 
@@ -176,45 +253,61 @@ class ObjcRuntimeDataParser:
             # prevents spamming the logs with errors about the same symbol
             # TODO(FS): Task tracking this issue SCAN-2744
             if string_file_address in visited_addresses:
+                self._next_undef_sym_idx = undef_sym_idx + 1
                 continue
-            visited_addresses.add(string_file_address)
 
             symbol_name = self.binary.get_full_string_from_start_address(string_file_address, virtual=False)
             if not symbol_name:
                 logger.error(f"Could not get symbol name at address {hex(string_file_address)}")
+                visited_addresses.add(string_file_address)
+                self._next_undef_sym_idx = undef_sym_idx + 1
                 continue
 
-            library_ordinal = self._library_ordinal_from_n_desc(sym.n_desc)
-            source_name = self.binary.dylib_name_for_library_ordinal(library_ordinal)
+            # The library ordinal is stored in the high byte of n_desc (GET_LIBRARY_ORDINAL in <mach-o/nlist.h>)
+            library_ordinal = (sym.n_desc >> 8) & 0xFF
+            source_name = library_ordinal_to_dylib_path.get(library_ordinal)
+            if source_name is None:
+                source_name = self.binary.dylib_name_for_library_ordinal(library_ordinal)
+                library_ordinal_to_dylib_path[library_ordinal] = source_name
 
             syms_to_dylib_path[symbol_name] = source_name
-        return syms_to_dylib_path
-
-    def path_for_external_symbol(self, symbol: str) -> Optional[str]:
-        if symbol in self._sym_to_dylib_path:
-            return self._sym_to_dylib_path[symbol]
+            visited_addresses.add(string_file_address)
+            self._next_undef_sym_idx = undef_sym_idx + 1
+            if symbol_name == stop_at_symbol:
+                return source_name
         return None
 
-    @staticmethod
-    def _library_ordinal_from_n_desc(n_desc: int) -> int:
-        return (n_desc >> 8) & 0xFF
+    def path_for_external_symbol(self, symbol: str) -> Optional[str]:
+        source_name = self._resolved_sym_to_dylib_path.get(symbol)
+        if source_name is not None:
+            return source_name
+        # Resolve more of the undefined symbols, stopping once we reach the requested one
+        return self._resolve_linked_dylib_symbols(stop_at_symbol=symbol)
 
     def _parse_selrefs(self) -> None:
         """Parse the binary's selref list, and store the data.
         Fully populates:
             self._selector_literal_ptr_to_selref_map
             self._selref_ptr_to_selref_map
-        *PARTIALLY* populates:
-            self._selref_ptr_to_selector_map
-        All selrefs keys will have an ObjcSelector value, but none of the ObjcSelector objects
-        will have their `implementation` field filled, because at this point in the parse we do not yet know the
-        implementations of each selector. ObjcSelectors which we later find an implementation for are
-        updated in self.read_selectors_from_methlist_ptr().
+            self._selector_name_to_selref_ptr
+        self._selref_ptr_to_selector_map is left empty, because at this point in the parse we do not yet know the
+        implementations of each selector. It is filled in by self.read_selectors_from_methlist_ptr(), and
+        selectors for selrefs without a local implementation are constructed on demand by
+        self.selector_for_selref().
         """
         selref_pointers = self.binary.read_pointer_section("__objc_selrefs")
+        # Several selrefs may point to the same selector literal. Read each distinct literal once
+        selector_literal_strings = {
+            selector_literal_ptr: self._read_objc_string(selector_literal_ptr)
+            for selector_literal_ptr in dict.fromkeys(selref_pointers.values())
+        }
+
+        selector_literal_ptr_to_selref_map = self._selector_literal_ptr_to_selref_map
+        selref_ptr_to_selref_map = self._selref_ptr_to_selref_map
+        selector_name_to_selref_ptr = self._selector_name_to_selref_ptr
         for selref_ptr, selector_literal_ptr in selref_pointers.items():
             # Read selector string literal from selref pointer
-            selector_string = self.binary.get_full_string_from_start_address(selector_literal_ptr)
+            selector_string = selector_literal_strings[selector_literal_ptr]
             if not selector_string:
                 # But all selectors should have a name
                 # TODO(PT): Is this an error?
@@ -222,12 +315,10 @@ class ObjcRuntimeDataParser:
             wrapped_selref = ObjcSelref(selref_ptr, selector_literal_ptr, selector_string)
 
             # Map the pointers to the wrapped-up selref object
-            self._selector_literal_ptr_to_selref_map[selector_literal_ptr] = wrapped_selref
-            self._selref_ptr_to_selref_map[wrapped_selref.source_address] = wrapped_selref
-
-            # And start off the selref pointer -> selector map
-            # We don't know the implementation address yet but it will be updated when we parse method lists
-            self._selref_ptr_to_selector_map[selref_ptr] = ObjcSelector(selector_string, wrapped_selref, None)
+            selector_literal_ptr_to_selref_map[selector_literal_ptr] = wrapped_selref
+            selref_ptr_to_selref_map[selref_ptr] = wrapped_selref
+            # If the same selector is referenced by several selrefs, keep the first one we see
+            selector_name_to_selref_ptr.setdefault(selector_string, selref_ptr)
 
     def selector_for_selref(self, selref_addr: VirtualMemoryPointer) -> Optional[ObjcSelector]:
         # This map contains selectors implemented in the binary
@@ -239,8 +330,10 @@ class ObjcRuntimeDataParser:
         selref = self._selref_ptr_to_selref_map.get(selref_addr)
         if selref is not None:
             # The selref must refer to a selector which is defined outside this binary
-            # This is fine, just construct an ObjcSelector with what we know
-            return ObjcSelector(selref.selector_literal, selref, None)
+            # This is fine, just construct an ObjcSelector with what we know, and reuse it for later lookups
+            selector = ObjcSelector(selref.selector_literal, selref, None)
+            self._selref_ptr_to_selector_map[selref_addr] = selector
+            return selector
 
         else:
             return None
@@ -253,22 +346,32 @@ class ObjcRuntimeDataParser:
             return None
 
     def selrefs_to_selectors(self) -> Dict[VirtualMemoryPointer, ObjcSelector]:
+        if not self._has_selector_for_every_selref:
+            # Construct the selectors which haven't been looked up yet
+            for selref_ptr in self._selref_ptr_to_selref_map:
+                if selref_ptr not in self._selref_ptr_to_selector_map:
+                    self.selector_for_selref(selref_ptr)
+            self._has_selector_for_every_selref = True
         return self._selref_ptr_to_selector_map
 
     def selref_for_selector_name(self, selector_name: str) -> Optional[VirtualMemoryPointer]:
-        return next(
-            (selref for selref, selector in self._selref_ptr_to_selector_map.items() if selector.name == selector_name),
-            None,
-        )
+        return self._selector_name_to_selref_ptr.get(selector_name)
+
+    def _build_selector_name_to_imps_map(self) -> Dict[str, List[VirtualMemoryPointer]]:
+        """Index the implemented selectors of every parsed class and category by selector name.
+        The IMPs for each name are kept in the order the classes were parsed.
+        """
+        selector_name_to_imps: Dict[str, List[VirtualMemoryPointer]] = {}
+        for objc_class in self.classes:
+            for objc_sel in objc_class.selectors:
+                if objc_sel.implementation:
+                    selector_name_to_imps.setdefault(objc_sel.name, []).append(objc_sel.implementation)
+        return selector_name_to_imps
 
     def get_method_imp_addresses(self, selector: str) -> List[VirtualMemoryPointer]:
         """Given a selector, return a list of virtual addresses corresponding to the start of each IMP for that SEL."""
-        return [
-            objc_sel.implementation
-            for objc_class in self.classes
-            for objc_sel in objc_class.selectors
-            if objc_sel.name == selector and objc_sel.implementation
-        ]
+        # Return a copy so callers can't modify the index
+        return list(self._selector_name_to_imps.get(selector, []))
 
     def objc_class_for_classlist_pointer(self, classlist_ptr: VirtualMemoryPointer) -> Optional[ObjcClass]:
         return self._classrefs_to_objc_classes.get(classlist_ptr)
@@ -325,9 +428,9 @@ class ObjcRuntimeDataParser:
 
     def _parse_class_and_category_info(self) -> List[ObjcClass]:
         """Parse classes and categories referenced by __objc_classlist and __objc_catlist."""
-        classes: List[ObjcClass] = []
-        classes += self._parse_objc_classes()
-        classes += self._parse_objc_categories()
+        # Append the categories to the freshly built list of classes, rather than copying both into a new list
+        classes = self._parse_objc_classes()
+        classes.extend(self._parse_objc_categories())
         # Link superclasses of classes and base-classes of categories
         self._add_superclass_or_base_class_name_to_classes(classes)
         return classes
@@ -384,13 +487,12 @@ class ObjcRuntimeDataParser:
         ivarlist = self.binary.read_struct(ivarlist_ptr, ObjcIvarListStruct, virtual=True)
         ivars: List[ObjcIvar] = []
         # Parse each ivar struct which follows the ivarlist
-        ivar_struct_ptr = ivarlist_ptr + ivarlist.sizeof
-        for _ in range(ivarlist.count):
-            ivar_struct = self.binary.read_struct_with_rebased_pointers(ivar_struct_ptr, ObjcIvarStruct, virtual=True)
-
-            ivar_name = self.binary.get_full_string_from_start_address(ivar_struct.name)
-            class_name = self.binary.get_full_string_from_start_address(ivar_struct.type)
-            field_offset_addr = ivar_struct.offset_ptr
+        ivar_entries = ObjcIvarStruct.read_ivar_list_entries(
+            self.binary, ivarlist_ptr + ivarlist.sizeof, ivarlist.count
+        )
+        for ivar_idx, (field_offset_addr, ivar_name_ptr, ivar_type_ptr) in enumerate(ivar_entries):
+            ivar_name = self._read_objc_string(VirtualMemoryPointer(ivar_name_ptr))
+            class_name = self._read_objc_string(VirtualMemoryPointer(ivar_type_ptr))
             # SCAN-2960: offset_ptr may be zero. Observed for the $defaultActor ivar within a Swift source class.
             field_offset = 0
             if field_offset_addr:
@@ -398,76 +500,80 @@ class ObjcRuntimeDataParser:
 
             # class_name and field_offset can be falsey ('' and 0), so don't include them in this sanity check
             if not ivar_name:
-                raise ValueError(f"Failed to read ivar data for ivar entry @ {hex(ivar_struct_ptr)}")
+                raise ValueError(
+                    f"Failed to read ivar data for ivar entry {ivar_idx} of ivar list @ {hex(ivarlist_ptr)}"
+                )
 
             ivar = ObjcIvar(ivar_name, class_name, field_offset, field_offset_addr)  # type: ignore
             ivars.append(ivar)
-
-            ivar_struct_ptr += ivar_struct.sizeof
         return ivars
 
     def read_selectors_from_methlist_ptr(self, methlist_ptr: VirtualMemoryPointer) -> List[ObjcSelector]:
         """Given the virtual address of a method list, return a List of ObjcSelectors encapsulating each method."""
+        return list(self._iter_selectors_from_methlist_ptr(methlist_ptr))
+
+    def _iter_selectors_from_methlist_ptr(self, methlist_ptr: VirtualMemoryPointer) -> Iterator[ObjcSelector]:
+        """Given the virtual address of a method list, yield an ObjcSelector encapsulating each method.
+        This allows the parser to collect the selectors of several method lists without building a List for each.
+        """
         methlist = self.binary.read_struct(methlist_ptr, ObjcMethodListStruct, virtual=True)
-        selectors: List[ObjcSelector] = []
         # parse every entry in method list
         # the first entry appears directly after the ObjcMethodListStruct
-        method_entry_off = methlist_ptr + methlist.sizeof
-        for i in range(methlist.methcount):
-            method_ent = ObjcMethodStruct.read_method_struct(
-                self.binary, method_entry_off, methlist_flags=methlist.flags
-            )
+        method_entries = ObjcMethodStruct.read_method_list_entries(
+            self.binary, methlist_ptr + methlist.sizeof, methlist.methcount, methlist_flags=methlist.flags
+        )
+        # This loop runs once for every method in the binary. Bind the attributes it uses to locals up front
+        get_string = self._read_objc_string
+        selector_literal_ptr_to_selref_map = self._selector_literal_ptr_to_selref_map
+        selref_ptr_to_selector_map = self._selref_ptr_to_selector_map
+        for name, _, implementation in method_entries:
+            name_ptr = VirtualMemoryPointer(name)
             # Byte-align IMP, as the lower bits are used for flags
-            method_ent.implementation &= ~0x3  # type: ignore
+            implementation &= ~0x3
 
-            symbol_name = self.binary.get_full_string_from_start_address(method_ent.name)
+            symbol_name = get_string(name_ptr)
             if not symbol_name:
-                raise ValueError(f"Could not get symbol name for {method_ent.name}")
+                raise ValueError(f"Could not get symbol name for {name_ptr}")
             # attempt to find corresponding selref
-            selref = self._selector_literal_ptr_to_selref_map.get(method_ent.name)
+            selref = selector_literal_ptr_to_selref_map.get(name_ptr)
 
-            selector = ObjcSelector(symbol_name, selref, VirtualMemoryPointer(method_ent.implementation))
-            selectors.append(selector)
+            if not selref:
+                yield ObjcSelector(symbol_name, selref, VirtualMemoryPointer(implementation))
+                continue
 
+            selector = ObjcSelector(symbol_name, selref, VirtualMemoryPointer(implementation))
             # save this selector in the selref pointer -> selector map
-            if selref:
-                # if this selector is already in the map, check if we now know the implementation address
-                # we could have parsed the selector literal/selref pair in _parse_selrefs() but not have known the
-                # implementation, but do now. It's also possible the selref is an external method, and thus will not
-                # have a local implementation.
-                most_specific_selector = selector
-                if selref.source_address in self._selref_ptr_to_selector_map:
-                    previously_parsed_selector = self._selref_ptr_to_selector_map[selref.source_address]
-                    # Did we already parse this same selector but with more specific information?
-                    # (Say, if we parse an ObjC class implementing a protocol before parsing the protocol itself)
-                    if previously_parsed_selector.implementation:
-                        # Make sure we keep the most specific selector we've seen
-                        most_specific_selector = previously_parsed_selector
-                self._selref_ptr_to_selector_map[selref.source_address] = most_specific_selector
-
-            method_entry_off += method_ent.sizeof
-        return selectors
+            # if this selector is already in the map, check if we now know the implementation address.
+            # It's also possible the selref is an external method, and thus will not have a local implementation.
+            selref_ptr = selref.source_address
+            previously_parsed_selector = selref_ptr_to_selector_map.get(selref_ptr)
+            # Did we already parse this same selector but with more specific information?
+            # (Say, if we parse an ObjC class implementing a protocol before parsing the protocol itself)
+            # Make sure we keep the most specific selector we've seen
+            if not previously_parsed_selector or not previously_parsed_selector.implementation:
+                selref_ptr_to_selector_map[selref_ptr] = selector
+            yield selector
 
     def _parse_objc_protocol_entry(self, objc_protocol_struct: ObjcProtocolRawStruct) -> ObjcProtocol:
-        symbol_name = self.binary.get_full_string_from_start_address(objc_protocol_struct.name)
+        symbol_name = self._read_objc_string(objc_protocol_struct.name)
         if not symbol_name:
             raise ValueError(f"Could not get symbol name for {objc_protocol_struct.name}")
 
         selectors: List[ObjcSelector] = []
         if objc_protocol_struct.required_instance_methods:
-            selectors += self.read_selectors_from_methlist_ptr(objc_protocol_struct.required_instance_methods)
+            selectors.extend(self._iter_selectors_from_methlist_ptr(objc_protocol_struct.required_instance_methods))
         if objc_protocol_struct.required_class_methods:
-            selectors += self.read_selectors_from_methlist_ptr(objc_protocol_struct.required_class_methods)
+            selectors.extend(self._iter_selectors_from_methlist_ptr(objc_protocol_struct.required_class_methods))
         if objc_protocol_struct.optional_instance_methods:
-            selectors += self.read_selectors_from_methlist_ptr(objc_protocol_struct.optional_instance_methods)
+            selectors.extend(self._iter_selectors_from_methlist_ptr(objc_protocol_struct.optional_instance_methods))
         if objc_protocol_struct.optional_class_methods:
-            selectors += self.read_selectors_from_methlist_ptr(objc_protocol_struct.optional_class_methods)
+            selectors.extend(self._iter_selectors_from_methlist_ptr(objc_protocol_struct.optional_class_methods))
 
         return ObjcProtocol(objc_protocol_struct, symbol_name, selectors)
 
     def _parse_objc_category_entry(self, objc_category_struct: ObjcCategoryRawStruct) -> ObjcCategory:
         # TODO(PT): Add in the methods of the base class to the ObjcCategory
-        symbol_name = self.binary.get_full_string_from_start_address(objc_category_struct.name)
+        symbol_name = self._read_objc_string(objc_category_struct.name)
         if not symbol_name:
             raise ValueError(f"Could not get symbol name for {objc_category_struct.name}")
 
@@ -482,9 +588,9 @@ class ObjcRuntimeDataParser:
         # if the class implements no methods, the pointer to method list will be the null pointer
         # TODO(PT): we could add some flag to keep track of whether a given sel is an instance or class method
         if objc_category_struct.instance_methods:
-            selectors += self.read_selectors_from_methlist_ptr(objc_category_struct.instance_methods)
+            selectors.extend(self._iter_selectors_from_methlist_ptr(objc_category_struct.instance_methods))
         if objc_category_struct.class_methods:
-            selectors += self.read_selectors_from_methlist_ptr(objc_category_struct.class_methods)
+            selectors.extend(self._iter_selectors_from_methlist_ptr(objc_category_struct.class_methods))
         if objc_category_struct.base_protocols:
             # TODO(PT): perhaps these should be combined into one call
             protocol_pointers = self._protolist_ptr_to_protocol_ptr_list(objc_category_struct.base_protocols)
@@ -495,7 +601,7 @@ class ObjcRuntimeDataParser:
     def _parse_objc_data_entry(
         self, objc_class_struct: ObjcClassRawStruct, objc_data_struct: ObjcDataRawStruct
     ) -> ObjcClass:
-        symbol_name = self.binary.get_full_string_from_start_address(objc_data_struct.name)
+        symbol_name = self._read_objc_string(objc_data_struct.name)
         if not symbol_name:
             raise ValueError(f"Could not get symbol name for {hex(objc_data_struct.name)}")
 
@@ -504,7 +610,7 @@ class ObjcRuntimeDataParser:
         ivars: List[ObjcIvar] = []
         # if the class implements no methods, base_methods will be the null pointer
         if objc_data_struct.base_methods:
-            selectors += self.read_selectors_from_methlist_ptr(objc_data_struct.base_methods)
+            selectors.extend(self._iter_selectors_from_methlist_ptr(objc_data_struct.base_methods))
         # if the class doesn't conform to any protocols, base_protocols will be null
         if objc_data_struct.base_protocols:
             protocol_pointer_list = self._protolist_ptr_to_protocol_ptr_list(objc_data_struct.base_protocols)
@@ -518,24 +624,22 @@ class ObjcRuntimeDataParser:
     def _protolist_ptr_to_protocol_ptr_list(self, protolist_ptr: VirtualMemoryPointer) -> List[VirtualMemoryPointer]:
         """Accepts the virtual address of an ObjcProtocolListStruct, and returns List of protocol pointers it refers to."""  # noqa: E501
         protolist = self.binary.read_struct(protolist_ptr, ObjcProtocolListStruct, virtual=True)
-        protocol_pointers: List[VirtualMemoryPointer] = []
         # pointers start directly after the 'count' field
-        addr = VirtualMemoryPointer(protolist.binary_offset + protolist.sizeof)
-        for i in range(protolist.count):
-            # This pointer may be rebased
-            pointer = self.binary.read_rebased_pointer(addr)
-            protocol_pointers.append(VirtualMemoryPointer(pointer))
-            # step to next protocol pointer in list
-            addr += sizeof(self.binary.platform_word_type)
-        return protocol_pointers
+        return self.binary.read_rebased_pointers(
+            VirtualMemoryPointer(protolist.binary_offset + protolist.sizeof), protolist.count
+        )
 
     def _parse_protocol_ptr_list(self, protocol_ptrs: List[VirtualMemoryPointer]) -> List[ObjcProtocol]:
         protocols = []
         for protocol_ptr in protocol_ptrs:
-            objc_protocol_struct = self._get_objc_protocol_from_pointer(protocol_ptr)
-            if objc_protocol_struct:
+            parsed_protocol = self._protocol_cache.get(protocol_ptr)
+            if parsed_protocol is None:
+                objc_protocol_struct = self._get_objc_protocol_from_pointer(protocol_ptr)
+                if not objc_protocol_struct:
+                    continue
                 parsed_protocol = self._parse_objc_protocol_entry(objc_protocol_struct)
-                protocols.append(parsed_protocol)
+                self._protocol_cache[protocol_ptr] = parsed_protocol
+            protocols.append(parsed_protocol)
         return protocols
 
     def _get_catlist_pointers(self) -> List[VirtualMemoryPointer]:
@@ -585,7 +689,7 @@ class ObjcRuntimeDataParser:
         """
         data_entry = self.binary.read_struct_with_rebased_pointers(objc_class.data, ObjcDataRawStruct, virtual=True)
         # ensure this is a valid entry
-        if data_entry.name < self.binary.get_virtual_base():
+        if data_entry.name < self._virtual_base:
             # TODO(PT): sometimes we'll get addresses passed to this method that are actually struct __objc_method
             # entries, rather than struct __objc_data entries. Investigate why this is.
             # This was observed on a 32bit binary, Esquire2
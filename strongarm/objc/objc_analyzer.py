@@ -2,7 +2,7 @@ import functools
 import shlex
 from itertools import starmap
 from subprocess import check_output
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from capstone import CsInsn
 from strongarm_dataflow.dataflow import get_register_contents_at_instruction_fast
@@ -110,6 +110,8 @@ class ObjcFunctionAnalyzer:
         self.method_info = method_info
 
         self._call_targets: Optional[List[ObjcBranchInstruction]] = None
+        # Map of _objc_msgSend call site addresses to the selref passed at that call site
+        self._selref_cache: Dict[VirtualMemoryPointer, VirtualMemoryPointer] = {}
 
         # Find basic-block-boundaries upfront
         self.basic_blocks = self._find_basic_blocks()
@@ -194,9 +196,7 @@ class ObjcFunctionAnalyzer:
         """
         from strongarm.macho.macho_analyzer import MachoAnalyzer
 
-        analyzer = MachoAnalyzer.get_analyzer(binary)
-        instructions = analyzer.get_function_instructions(start_address)
-        return ObjcFunctionAnalyzer(binary, instructions)
+        return MachoAnalyzer.get_analyzer(binary).get_function_analyzer(start_address)
 
     @classmethod
     def get_function_analyzer_for_method(
@@ -250,12 +250,11 @@ class ObjcFunctionAnalyzer:
 
         # Extract the list of branch instructions in the function
         branches_in_function: List[ObjcBranchInstruction] = []
-        for idx, instr in enumerate(self.instructions):
+        function_boundary = (self.start_address, self.end_address)
+        for instr in self.instructions:
             if ObjcBranchInstruction.is_branch_instruction(instr):
                 branches_in_function.append(
-                    ObjcBranchInstruction.parse_instruction(
-                        self, instr, container_function_boundary=(self.start_address, self.end_address)
-                    )
+                    ObjcBranchInstruction.parse_instruction(self, instr, container_function_boundary=function_boundary)
                 )
 
         self._call_targets = branches_in_function
@@ -281,6 +280,10 @@ class ObjcFunctionAnalyzer:
             # might be objc_msgSend to object of class defined outside binary
             if target.is_external_objc_call:
                 continue
+            # a stub which isn't backed by a named symbol isn't marked as an external call, but it's still just a
+            # trampoline out of the binary. Don't try to disassemble it as a function
+            if self.macho_analyzer.is_imp_stub_address(target.destination_address):
+                continue
             call_targets.append(ObjcFunctionAnalyzer.get_function_analyzer(self.binary, target.destination_address))
         return call_targets
 
@@ -319,11 +322,18 @@ class ObjcFunctionAnalyzer:
         if msgsend_instr.raw_instr.mnemonic not in ObjcUnconditionalBranchInstruction.UNCONDITIONAL_BRANCH_MNEMONICS:
             raise ValueError("get_objc_selref() called on non-branch instruction")
 
+        # Call sites are re-wrapped each time an instruction is parsed, so look up previous results by address
+        selref_ptr = self._selref_cache.get(msgsend_instr.address)
+        if selref_ptr is not None:
+            return selref_ptr
+
         # at an _objc_msgSend call site, the selref is in x1
         contents = self.get_register_contents_at_instruction("x1", msgsend_instr)
         if contents.type != RegisterContentsType.IMMEDIATE:
             raise RuntimeError(f"could not determine selref ptr, origates in function arg (type {contents.type.name})")
-        return VirtualMemoryPointer(contents.value)
+        selref_ptr = VirtualMemoryPointer(contents.value)
+        self._selref_cache[msgsend_instr.address] = selref_ptr
+        return selref_ptr
 
     @functools.lru_cache(maxsize=100)
     def get_register_contents_at_instruction(self, register: str, instruction: ObjcInstruction) -> RegisterContents:
@@ -1,7 +1,17 @@
-from typing import TYPE_CHECKING, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
 
 from capstone import CsInsn
-from capstone.arm64 import ARM64_OP_IMM, ARM64_OP_MEM, ARM64_OP_REG, Arm64Op
+from capstone.arm64 import (
+    ARM64_INS_B,
+    ARM64_INS_BL,
+    ARM64_INS_CBNZ,
+    ARM64_INS_CBZ,
+    ARM64_INS_TBNZ,
+    ARM64_OP_IMM,
+    ARM64_OP_MEM,
+    ARM64_OP_REG,
+    Arm64Op,
+)
 
 from strongarm.macho.macho_analyzer import MachoAnalyzer
 from strongarm.macho.macho_definitions import VirtualMemoryPointer
@@ -13,6 +23,9 @@ if TYPE_CHECKING:
 
 class ObjcInstruction:
     VECTOR_REGISTER_PREFIXES = ["d", "s", "v"]
+    # Map of capstone register IDs to whether they refer to a vector register.
+    # There are only a few hundred ARM64 registers, so this is filled in lazily and never evicted
+    _REGISTER_ID_IS_VECTOR: Dict[int, bool] = {}
 
     def __init__(self, instruction: CsInsn) -> None:
         self.raw_instr = instruction
@@ -34,16 +47,22 @@ class ObjcInstruction:
 
     @classmethod
     def _operand_uses_vector_registers(cls, instruction: CsInsn, operand: Arm64Op) -> bool:
-        if operand.type == ARM64_OP_IMM:
+        operand_type = operand.type
+        if operand_type == ARM64_OP_IMM:
             return False
 
-        if operand.type == ARM64_OP_REG:
-            reg_name = instruction.reg_name(operand.value.reg)
-        elif operand.type == ARM64_OP_MEM:
-            reg_name = instruction.reg_name(operand.mem.base)
+        if operand_type == ARM64_OP_REG:
+            reg_id = operand.value.reg
+        elif operand_type == ARM64_OP_MEM:
+            reg_id = operand.mem.base
         else:
-            raise RuntimeError(f"unknown operand type {operand.type} in instr at {instruction.address}")
-        return ObjcInstruction.is_vector_register(reg_name)
+            raise RuntimeError(f"unknown operand type {operand_type} in instr at {instruction.address}")
+
+        is_vector = ObjcInstruction._REGISTER_ID_IS_VECTOR.get(reg_id)
+        if is_vector is None:
+            is_vector = ObjcInstruction.is_vector_register(instruction.reg_name(reg_id))
+            ObjcInstruction._REGISTER_ID_IS_VECTOR[reg_id] = is_vector
+        return is_vector
 
     @classmethod
     def instruction_uses_vector_registers(cls, instruction: CsInsn) -> bool:
@@ -66,6 +85,11 @@ class ObjcInstruction:
 
 
 class ObjcBranchInstruction(ObjcInstruction):
+    # Capstone instruction IDs of every branch mnemonic we handle.
+    # Comparing the integer ID is cheaper than decoding the mnemonic string, so use it to rule out most instructions.
+    # This is a superset: capstone uses ARM64_INS_B for every b.cond, so the mnemonic must still be checked
+    _BRANCH_INSTRUCTION_IDS = frozenset([ARM64_INS_B, ARM64_INS_BL, ARM64_INS_CBZ, ARM64_INS_CBNZ, ARM64_INS_TBNZ])
+
     def __init__(self, instruction: CsInsn, destination_address: VirtualMemoryPointer) -> None:
         super(ObjcBranchInstruction, self).__init__(instruction)
 
@@ -86,48 +110,56 @@ class ObjcBranchInstruction(ObjcInstruction):
         container_function_boundary: Tuple[VirtualMemoryPointer, VirtualMemoryPointer] = None,
     ) -> Union["ObjcUnconditionalBranchInstruction", "ObjcConditionalBranchInstruction"]:
         """Read a branch instruction and encapsulate it in the appropriate ObjcBranchInstruction subclass."""
+        # CsInsn decodes the mnemonic on every access, so read it once
+        mnemonic = instruction.mnemonic
         # use appropriate subclass
-        if instruction.mnemonic in ObjcUnconditionalBranchInstruction.UNCONDITIONAL_BRANCH_MNEMONICS:
+        if mnemonic in ObjcUnconditionalBranchInstruction.UNCONDITIONAL_BRANCH_MNEMONICS:
             uncond_instr = ObjcUnconditionalBranchInstruction(
                 function_analyzer, instruction, patch_msgSend_destination, container_function_boundary
             )
             return uncond_instr
 
-        elif instruction.mnemonic in ObjcConditionalBranchInstruction.CONDITIONAL_BRANCH_MNEMONICS:
+        elif mnemonic in ObjcConditionalBranchInstruction.CONDITIONAL_BRANCH_MNEMONICS:
             cond_instr = ObjcConditionalBranchInstruction(function_analyzer, instruction)
             return cond_instr
 
         else:
-            raise ValueError(f"Unknown branch mnemonic {instruction.mnemonic}")
+            raise ValueError(f"Unknown branch mnemonic {mnemonic}")
 
     @classmethod
     def is_branch_instruction(cls, instruction: CsInsn) -> bool:
         """Returns True if the CsInsn represents a branch instruction, False otherwise."""
         # TODO(FS): Merge subclasses into ObjcBranchInstruction and provide contextual information about each variant
+        if instruction.id not in ObjcBranchInstruction._BRANCH_INSTRUCTION_IDS:
+            return False
+        mnemonic = instruction.mnemonic
         return (
-            instruction.mnemonic in ObjcUnconditionalBranchInstruction.UNCONDITIONAL_BRANCH_MNEMONICS
-            or instruction.mnemonic in ObjcConditionalBranchInstruction.CONDITIONAL_BRANCH_MNEMONICS
+            mnemonic in ObjcUnconditionalBranchInstruction.UNCONDITIONAL_BRANCH_MNEMONICS
+            or mnemonic in ObjcConditionalBranchInstruction.CONDITIONAL_BRANCH_MNEMONICS
         )
 
 
 class ObjcUnconditionalBranchInstruction(ObjcBranchInstruction):
-    UNCONDITIONAL_BRANCH_MNEMONICS = [
-        "b",
-        "bl",
-        "bx",
-        "blx",
-        "bxj",
-        "b.eq",  # TODO(PT): these b-suffix are not strictly unconditional branches, but
-        # they're functionally unconditional for what we care about
-        "b.ne",
-        "b.ge",
-        "b.le",
-        "b.gt",
-        "b.lt",
-        "b.hi",
-        "b.lo",
-    ]
-    OBJC_MSGSEND_FUNCTIONS = ["_objc_msgSend", "_objc_msgSendSuper2"]
+    # Sets, as these are checked against the mnemonic of every instruction in a function
+    UNCONDITIONAL_BRANCH_MNEMONICS = frozenset(
+        [
+            "b",
+            "bl",
+            "bx",
+            "blx",
+            "bxj",
+            "b.eq",  # TODO(PT): these b-suffix are not strictly unconditional branches, but
+            # they're functionally unconditional for what we care about
+            "b.ne",
+            "b.ge",
+            "b.le",
+            "b.gt",
+            "b.lt",
+            "b.hi",
+            "b.lo",
+        ]
+    )
+    OBJC_MSGSEND_FUNCTIONS = frozenset(["_objc_msgSend", "_objc_msgSendSuper2"])
 
     def __init__(
         self,
@@ -221,23 +253,22 @@ class ObjcUnconditionalBranchInstruction(ObjcBranchInstruction):
 
 
 class ObjcConditionalBranchInstruction(ObjcBranchInstruction):
-    SINGLE_OP_MNEMONICS = ["cbz", "cbnz"]
-    DOUBLE_OP_MNEMONICS = ["tbnz"]
-    CONDITIONAL_BRANCH_MNEMONICS = SINGLE_OP_MNEMONICS + DOUBLE_OP_MNEMONICS
+    SINGLE_OP_MNEMONICS = frozenset(["cbz", "cbnz"])
+    DOUBLE_OP_MNEMONICS = frozenset(["tbnz"])
+    CONDITIONAL_BRANCH_MNEMONICS = SINGLE_OP_MNEMONICS | DOUBLE_OP_MNEMONICS
 
     def __init__(self, function_analyzer: "ObjcFunctionAnalyzer", instruction: CsInsn) -> None:
-        if instruction.mnemonic not in ObjcConditionalBranchInstruction.CONDITIONAL_BRANCH_MNEMONICS:
-            raise ValueError(
-                f"ObjcConditionalBranchInstruction instantiated with" f" invalid mnemonic {instruction.mnemonic}"
-            )
+        mnemonic = instruction.mnemonic
+        if mnemonic not in ObjcConditionalBranchInstruction.CONDITIONAL_BRANCH_MNEMONICS:
+            raise ValueError(f"ObjcConditionalBranchInstruction instantiated with" f" invalid mnemonic {mnemonic}")
 
         # a conditional branch will either hold the destination in first or second operand, depending on mnemonic
-        if instruction.mnemonic in ObjcConditionalBranchInstruction.SINGLE_OP_MNEMONICS:
+        if mnemonic in ObjcConditionalBranchInstruction.SINGLE_OP_MNEMONICS:
             dest_op_idx = 1
-        elif instruction.mnemonic in ObjcConditionalBranchInstruction.DOUBLE_OP_MNEMONICS:
+        elif mnemonic in ObjcConditionalBranchInstruction.DOUBLE_OP_MNEMONICS:
             dest_op_idx = 2
         else:
-            raise ValueError(f"Unknown conditional mnemonic {instruction.mnemonic}")
+            raise ValueError(f"Unknown conditional mnemonic {mnemonic}")
 
         ObjcBranchInstruction.__init__(
             self, instruction, VirtualMemoryPointer(instruction.operands[dest_op_idx].value.imm)
@@ -1,11 +1,14 @@
-"""These tests cannot run in CI as they require a dyld_shared_cache image, which is > 1GB
+"""Most of these tests cannot run in CI as they require a dyld_shared_cache image, which is > 1GB
 """
 import os
+from ctypes import sizeof
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import pytest
 
-from strongarm.macho import DyldSharedCacheParser, MachoAnalyzer, VirtualMemoryPointer
+from strongarm.macho import DyldSharedCacheParser, MachoAnalyzer, StaticFilePointer, VirtualMemoryPointer
+from strongarm.macho.macho_definitions import DyldSharedCacheHeader, DyldSharedFileMapping, VMProtFlags
 
 # XXX(PT): This test suite expects to run on a mounted IPSW of iOS 12.1.1 iPad 6 WiFi
 _FIRMWARE_ROOT = Path("/") / "Volumes" / "PeaceC16C50.J71bJ72bJ71sJ72sJ71tJ72tOS"
@@ -77,3 +80,50 @@ class TestDyldSharedCache:
             "_mach_init_routine": 0x1B7C574B0,
         }
         assert analyzer.exported_symbol_names_to_pointers == expected_exports
+
+
+def _write_minimal_dsc(path: Path) -> None:
+    """Write a dyld_shared_cache containing only a header and the three expected mappings, with no images."""
+    header = DyldSharedCacheHeader()
+    header.magic = b"dyld_v1   arm64"
+    header.mappingOffset = sizeof(DyldSharedCacheHeader)
+    header.mappingCount = 3
+    header.imagesOffset = header.mappingOffset + 3 * sizeof(DyldSharedFileMapping)
+    header.imagesCount = 0
+
+    mapping_protections = [
+        VMProtFlags.VM_PROT_READ | VMProtFlags.VM_PROT_EXECUTE,
+        VMProtFlags.VM_PROT_READ | VMProtFlags.VM_PROT_WRITE,
+        VMProtFlags.VM_PROT_READ,
+    ]
+    file_contents = bytearray(header)
+    for mapping_idx, prot in enumerate(mapping_protections):
+        mapping = DyldSharedFileMapping()
+        mapping.address = 0x180000000 + mapping_idx * 0x1000
+        mapping.size = 0x1000
+        mapping.max_prot = prot
+        mapping.init_prot = prot
+        file_contents += bytearray(mapping)
+    path.write_bytes(file_contents)
+
+
+class TestDyldSharedCacheLifecycle:
+    def test_close_releases_file_mapping(self) -> None:
+        with TemporaryDirectory() as tempdir:
+            dsc_path = Path(tempdir) / "dyld_shared_cache_arm64"
+            _write_minimal_dsc(dsc_path)
+
+            # Given I open a DSC within a with-statement
+            with DyldSharedCacheParser(dsc_path) as dyld_shared_cache:
+                assert dyld_shared_cache.file_magic == 0x646C7964
+                assert len(dyld_shared_cache.segment_mappings) == 3
+                # And I hold a view of some bytes read from it, as a MachoBinary does for an embedded image
+                header_bytes = dyld_shared_cache.get_bytes(StaticFilePointer(0), 16)
+                header_view = memoryview(header_bytes)
+
+            # When the with-statement exits
+            # Then the view is unaffected, as reads copy out of the file mapping rather than pinning it
+            assert header_view.tobytes() == b"dyld_v1   arm64\x00"
+            # And the file can no longer be read
+            with pytest.raises(ValueError):
+                dyld_shared_cache.get_bytes(StaticFilePointer(0), 4)
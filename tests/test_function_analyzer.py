@@ -63,6 +63,28 @@ class TestFunctionAnalyzer:
                     correct_sym_name = external_targets[target.destination_address]
                     assert target.symbol == correct_sym_name
 
+    def test_function_call_targets_skip_stubs(self) -> None:
+        # Given a function which branches to a __stubs trampoline that isn't backed by a named symbol
+        binary = MachoParser(pathlib.Path(__file__).parent / "bin" / "TestBinary5").get_arm64_slice()
+        assert binary
+        analyzer = MachoAnalyzer.get_analyzer(binary)
+        function_analyzer = ObjcFunctionAnalyzer.get_function_analyzer(binary, VirtualMemoryPointer(0x1000A95C0))
+        stub_branches = [
+            target
+            for target in function_analyzer.call_targets
+            if target.destination_address and analyzer.is_imp_stub_address(target.destination_address)
+        ]
+        assert [target.destination_address for target in stub_branches] == [VirtualMemoryPointer(0x1000ACBA0)]
+        assert not stub_branches[0].is_external_c_call
+        assert not stub_branches[0].is_external_objc_call
+
+        # When I ask for the functions reachable from it
+        call_targets = function_analyzer.function_call_targets
+
+        # Then the stub is not disassembled as a function
+        for call_target in call_targets:
+            assert not analyzer.is_imp_stub_address(call_target.start_address)
+
     def test_get_register_contents_at_instruction(self) -> None:
         from strongarm.objc import RegisterContentsType
 
@@ -120,6 +142,19 @@ class TestFunctionAnalyzer:
         with pytest.raises(ValueError):
             self.function_analyzer.get_objc_selref(non_branch_instruction)  # type: ignore
 
+    def test_get_selref_reparsed_call_site(self) -> None:
+        # Given a call site whose selref has already been resolved
+        objc_msgSendInstr = ObjcInstruction.parse_instruction(self.function_analyzer, self.instructions[16])
+        assert isinstance(objc_msgSendInstr, ObjcUnconditionalBranchInstruction)
+        assert self.function_analyzer.get_objc_selref(objc_msgSendInstr) == 0x1000090C0
+
+        # When the call site is parsed again, the selref is reused without rerunning dataflow analysis
+        reparsed_instr = ObjcInstruction.parse_instruction(self.function_analyzer, self.instructions[16])
+        assert isinstance(reparsed_instr, ObjcUnconditionalBranchInstruction)
+        with mock.patch.object(ObjcFunctionAnalyzer, "get_register_contents_at_instruction") as mock_dataflow:
+            assert self.function_analyzer.get_objc_selref(reparsed_instr) == 0x1000090C0
+            mock_dataflow.assert_not_called()
+
     def test_three_op_add(self) -> None:
         # 0x000000010000665c         adrp       x0, #0x102a41000
         # 0x0000000100006660         add        x0, x0, #0x458
@@ -209,6 +244,15 @@ class TestFunctionAnalyzer:
         symbol_name = analyzer.get_symbol_name()
         assert symbol_name == "-[TestClass testMethod:]"
 
+    def test_get_function_analyzer_is_shared(self) -> None:
+        # Given the analyzer for a function
+        imp_addr = VirtualMemoryPointer(self.imp_addr)
+        function_analyzer = ObjcFunctionAnalyzer.get_function_analyzer(self.binary, imp_addr)
+        assert function_analyzer.start_address == imp_addr
+        # When I ask for the analyzer for the same function again
+        # Then the same analyzer is returned
+        assert ObjcFunctionAnalyzer.get_function_analyzer(self.binary, imp_addr) is function_analyzer
+
     def test_get_symbol_name_exported_c_function(self) -> None:
         # Given a function analyzer which is associated with an exported symbol name
         with mock.patch("strongarm.macho.MachoStringTableHelper.get_symbol_name_for_address", return_value="_strlen"):
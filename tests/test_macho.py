@@ -8,8 +8,12 @@ from strongarm.macho import (
     HEADER_FLAGS,
     BinaryEncryptedError,
     MachoBinary,
+    MachoHeader64,
+    MachoHeaderStruct,
     MachoParser,
     MachoSegmentCommand64,
+    MachoSegmentCommandStruct,
+    MachoStringTableHelper,
     NoEmptySpaceForLoadCommandError,
     StaticFilePointer,
     VirtualMemoryPointer,
@@ -146,6 +150,19 @@ class TestMachoBinary:
         # Then I get the correct data out
         assert read_strings == correct_strings
 
+    def test_transform_string_section_accepts_list_or_bytes(self) -> None:
+        # Given the binary's string table as a list of byte values, and as bytes
+        string_table = self.binary.get_raw_string_table()
+        # If I transform each into string table entries
+        entries_from_list = MachoStringTableHelper.transform_string_section(string_table)
+        entries_from_bytes = MachoStringTableHelper.transform_string_section(bytes(string_table))
+        # Then the same entries are produced
+        assert entries_from_list.keys() == entries_from_bytes.keys()
+        for start_idx, entry in entries_from_list.items():
+            assert entry.full_string == entries_from_bytes[start_idx].full_string
+        mh_execute_header_idx = bytes(string_table).index(b"__mh_execute_header")
+        assert entries_from_bytes[mh_execute_header_idx].full_string == "__mh_execute_header"
+
     def test_read_classlist_data_segment(self) -> None:
         # Given a binary which stores the __objc_classlist section in the __DATA segment
         binary_with_data_classlist = MachoParser(TestMachoBinary.THIN_PATH).get_arm64_slice()
@@ -175,6 +192,34 @@ class TestMachoBinary:
         # Then I get the correct data
         assert sorted(locations_entries.items()) == sorted(correct_locations_entries.items())
 
+    def test_read_rebased_pointers(self) -> None:
+        # Given a binary with an __objc_classlist pointer section
+        binary = MachoParser(TestMachoBinary.THIN_PATH).get_arm64_slice()
+        assert binary
+
+        # If I read the pointers in the section as a single array
+        pointers = binary.read_rebased_pointers(VirtualMemoryPointer(0x100008178), 4)
+
+        # Then I get the same pointers as when reading each pointer individually
+        assert pointers == [0x100009120, 0x100009170, 0x1000091E8, 0x100009238]
+        assert pointers == [binary.read_rebased_pointer(VirtualMemoryPointer(0x100008178 + i * 8)) for i in range(4)]
+        # And an empty array requires no read
+        assert binary.read_rebased_pointers(VirtualMemoryPointer(0x100008178), 0) == []
+
+    def test_read_struct_matches_ctypes_layout(self) -> None:
+        # Given a binary
+        binary = MachoParser(TestMachoBinary.THIN_PATH).get_arm64_slice()
+        assert binary
+
+        # If I read structures which are unpacked without going through ctypes
+        header = binary.read_struct(0, MachoHeaderStruct)
+        segment = binary.read_struct(header.sizeof, MachoSegmentCommandStruct)
+        for struct, layout in [(header, MachoHeader64), (segment, MachoSegmentCommand64)]:
+            ctypes_struct = layout.from_buffer(binary.get_bytes(StaticFilePointer(struct.binary_offset), struct.sizeof))
+            # Then every field has the same value as in the ctypes layout
+            for field_name, *_ in layout._fields_:
+                assert getattr(struct, field_name) == getattr(ctypes_struct, field_name)
+
     def test_function_starts_command(self) -> None:
         # Given a binary that contains functions
         binary_with_functions = MachoParser(TestMachoBinary.CLASSLIST_DATA_CONST).get_arm64_slice()
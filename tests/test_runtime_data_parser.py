@@ -55,9 +55,12 @@ class TestObjcRuntimeDataParser:
             "_rand": "/usr/lib/libSystem.B.dylib",
             "dyld_stub_binder": "/usr/lib/libSystem.B.dylib",
         }
+        # Look up a symbol before the others are resolved
+        assert objc_parser.path_for_external_symbol("_objc_msgSend") == "/usr/lib/libobjc.A.dylib"
         for symbol in correct_map:
             assert objc_parser.path_for_external_symbol(symbol) == correct_map[symbol]
         assert objc_parser.path_for_external_symbol("XXX_fake_symbol_XXX") is None
+        assert correct_map.items() <= objc_parser._sym_to_dylib_path.items()
 
     def test_ios15_path_for_external_symbol(self) -> None:
         parser = MachoParser(TestObjcRuntimeDataParser.IOS15_CHAINED_FIXUP_POINTERS_BIN_PATH)
@@ -194,6 +197,22 @@ class TestObjcRuntimeDataParser:
         # this class doesn't conform to any protocols
         check_class_conformed_protocols("BadFilesDetector", [])
 
+    def test_conformed_protocols_are_parsed_once(self) -> None:
+        # Given a binary with several classes which conform to protocols
+        parser = MachoParser(TestObjcRuntimeDataParser.CATEGORY_PATH)
+        binary = parser.get_arm64_slice()
+        assert binary
+        objc_parser = ObjcRuntimeDataParser(binary)
+
+        # When I collect the protocols that each class conforms to
+        conformed_protocols = [protocol for cls in objc_parser.classes for protocol in cls.protocols]
+        assert len(conformed_protocols) > len({protocol.name for protocol in conformed_protocols})
+
+        # Then every reference to the same protocol shares one parsed ObjcProtocol
+        protocols_by_address = {protocol.raw_struct.binary_offset: protocol for protocol in conformed_protocols}
+        for protocol in conformed_protocols:
+            assert protocols_by_address[protocol.raw_struct.binary_offset] is protocol
+
     def test_protocol_32bit(self) -> None:
         parser = MachoParser(TestObjcRuntimeDataParser.PROTOCOL_32BIT_PATH)
         binary = parser.get_armv7_slice()
@@ -411,3 +430,71 @@ class TestObjcRuntimeDataParser:
         # When I look at its selectors,
         # Then none of them have an implementation address set
         assert not any(x.implementation for x in app_delegate_proto.selectors)
+
+    def test_selref_for_selector_name(self) -> None:
+        # Given a binary containing selrefs for both locally implemented and imported selectors
+        parser = MachoParser(TestObjcRuntimeDataParser.IOS15_CHAINED_FIXUP_POINTERS_BIN_PATH)
+        binary = parser.get_arm64_slice()
+        objc_parser = ObjcRuntimeDataParser(binary)
+
+        # When I look up the selref for a selector name
+        # Then the selref which references that selector is returned
+        assert objc_parser.selref_for_selector_name("viewDidLoad") == VirtualMemoryPointer(0x10000D278)
+        assert objc_parser.selref_for_selector_name("role") == VirtualMemoryPointer(0x10000D280)
+        # And selectors which are not referenced by any selref are not found
+        assert objc_parser.selref_for_selector_name("XXX_fake_selector_XXX") is None
+
+    def test_get_method_imp_addresses(self) -> None:
+        # Given a binary with several classes implementing methods
+        parser = MachoParser(TestObjcRuntimeDataParser.CATEGORY_PATH)
+        binary = parser.get_arm64_slice()
+        objc_parser = ObjcRuntimeDataParser(binary)
+
+        # When I look up the IMPs of each implemented selector
+        for objc_class in objc_parser.classes:
+            for objc_sel in objc_class.selectors:
+                if not objc_sel.implementation:
+                    continue
+                # Then every implementation of the selector, across all classes, is returned in parse order
+                correct_imps = [
+                    sel.implementation
+                    for cls in objc_parser.classes
+                    for sel in cls.selectors
+                    if sel.name == objc_sel.name and sel.implementation
+                ]
+                assert objc_parser.get_method_imp_addresses(objc_sel.name) == correct_imps
+        # And selectors without a local implementation have no IMPs
+        assert objc_parser.get_method_imp_addresses("XXX_fake_selector_XXX") == []
+
+    def test_selref_selector_is_shared_with_implementing_class(self) -> None:
+        # Given a binary with a class which implements a selector that is also referenced by a selref
+        parser = MachoParser(TestObjcRuntimeDataParser.IOS15_CHAINED_FIXUP_POINTERS_BIN_PATH)
+        binary = parser.get_arm64_slice()
+        objc_parser = ObjcRuntimeDataParser(binary)
+
+        # When I look up the selector for the selref
+        selector = objc_parser.selector_for_selref(VirtualMemoryPointer(0x10000D278))
+
+        # Then the selector describes the local implementation
+        assert selector.name == "viewDidLoad"
+        assert selector.implementation
+        assert not selector.is_external_definition
+        # And it's the same selector object that the implementing class holds
+        class_selectors = [sel for cls in objc_parser.classes for sel in cls.selectors if sel.name == "viewDidLoad"]
+        assert any(sel is selector for sel in class_selectors)
+
+    def test_external_selref_selector_is_reused(self) -> None:
+        # Given a binary with a selref to a selector which is implemented outside the binary
+        parser = MachoParser(TestObjcRuntimeDataParser.IOS15_CHAINED_FIXUP_POINTERS_BIN_PATH)
+        binary = parser.get_arm64_slice()
+        objc_parser = ObjcRuntimeDataParser(binary)
+
+        # When I look up the selector for the selref
+        selector = objc_parser.selector_for_selref(VirtualMemoryPointer(0x10000D280))
+
+        # Then the selector describes the external definition
+        assert selector.name == "role"
+        assert selector.is_external_definition
+        # And the same selector is returned by later lookups
+        assert objc_parser.selector_for_selref(VirtualMemoryPointer(0x10000D280)) is selector
+        assert objc_parser.selrefs_to_selectors()[VirtualMemoryPointer(0x10000D280)] is selector